@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left
 from collections import Counter, defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import DefaultDict
 
 from .. import parser
 
 
-@dataclass
+@dataclass(slots=True)
 class Totals:
     requests: int = 0
     pages: int = 0
@@ -19,7 +22,7 @@ class Totals:
     last_event: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueStat:
     queue: str
     requests_pct: float
@@ -28,14 +31,14 @@ class QueueStat:
     pages: int
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueUserStat:
     queue: str
     user: str
     pages: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStat:
     user: str
     requests: int
@@ -43,7 +46,7 @@ class UserStat:
     pages_per_request: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalPoint:
     key: str  # hour (00-23) or date (YYYY-MM-DD)
     requests: int
@@ -51,21 +54,21 @@ class TemporalPoint:
     within_hours: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobBucket:
     label: str
     pct_requests: float
     request_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyBucket:
     label: str
     pct_requests: float
     request_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CostStat:
     label: str
     pages: int
@@ -74,13 +77,13 @@ class CostStat:
     amount: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SimpleStat:
     label: str
     pages: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     totals: Totals
     queue_stats: list[QueueStat]
@@ -97,6 +100,9 @@ class AnalysisReport:
     duplex_stats: list[SimpleStat]
 
 
+# Sections that can be switched off via ``[core] enabled_sections``
+REPORT_SECTIONS = ("queue", "queue_user", "user", "temporal", "job", "cost")
+
 JOB_BUCKETS = [
     (0, 10, "0-10"),
     (11, 20, "11-20"),
@@ -122,6 +128,8 @@ COPY_BUCKETS = [
     (101, None, "100+"),
 ]
 
+_HOUR_KEYS = [f"{hour:02d}:00" for hour in range(24)]
+
 
 class UsageAggregator:
     """Incrementally compute PrintAudit statistics."""
@@ -136,130 +144,245 @@ class UsageAggregator:
         cost_label_rates: dict[str, float] | None = None,
     ):
         self.totals = Totals()
-        self.queue_requests: Counter[str] = Counter()
-        self.queue_pages: Counter[str] = Counter()
+        # [requests, pages] rows, updated together for the same key
+        self.queue_usage: DefaultDict[str, list[int]] = defaultdict(_usage)
         self.queue_user_pages: Counter[tuple[str, str]] = Counter()
-        self.user_requests: Counter[str] = Counter()
-        self.user_pages: Counter[str] = Counter()
-        self.hourly: Counter[str] = Counter()
-        self.hourly_pages: Counter[str] = Counter()
-        self.daily: Counter[str] = Counter()
-        self.daily_pages: Counter[str] = Counter()
-        self.job_histogram: Counter[str] = Counter()
-        self.copy_histogram: Counter[str] = Counter()
+        self.user_usage: DefaultDict[str, list[int]] = defaultdict(_usage)
+        self.hourly_usage: DefaultDict[str, list[int]] = defaultdict(_usage)
+        self.daily_usage: DefaultDict[str, list[int]] = defaultdict(_usage)
+        # Raw pages/copies per request; bucketed once in build_report
+        self.job_pages: Counter[int] = Counter()
+        self.job_copies: Counter[int] = Counter()
         self.cost_pages: Counter[str] = Counter()
-        self.cost_user_pages: DefaultDict[str, Counter[str]] = defaultdict(
-            Counter
-        )
-        self.cost_queue_pages: DefaultDict[str, Counter[str]] = defaultdict(
-            Counter
-        )
+        self.cost_user_pages: Counter[tuple[str, str]] = Counter()
+        self.cost_queue_pages: Counter[tuple[str, str]] = Counter()
         self.client_pages: Counter[str] = Counter()
         self.document_pages: Counter[str] = Counter()
         self.media_pages: Counter[str] = Counter()
         self.duplex_pages: Counter[str] = Counter()
         self.cost_rules = cost_rules or {}
+        self._cost_rule_tokens = _compile_cost_rules(self.cost_rules)
         self.work_start = work_start
         self.work_end = work_end
         self.cost_default = cost_default
         self.cost_printer_rates = cost_printer_rates or {}
         self.cost_label_rates = cost_label_rates or {}
+        self._cost_label_rates_lc = {
+            name.lower(): rate for name, rate in self.cost_label_rates.items()
+        }
+        self._cost_printer_rates_lc = {
+            queue.lower(): rate
+            for queue, rate in self.cost_printer_rates.items()
+        }
+        self._day_cache: dict[date, str] = {}
+        self._haystack_cache: dict[tuple[str, str, str], tuple[str, str]] = {}
 
     def ingest(self, entry: parser.LogEntry) -> None:
-        self.totals.requests += 1
-        self.totals.pages += entry.pages
-        if (
-            not self.totals.first_event
-            or entry.timestamp < self.totals.first_event
-        ):
-            self.totals.first_event = entry.timestamp
-        if (
-            not self.totals.last_event
-            or entry.timestamp > self.totals.last_event
-        ):
-            self.totals.last_event = entry.timestamp
+        self.ingest_tuple(
+            entry.printer,
+            entry.user,
+            entry.job_id,
+            entry.timestamp,
+            entry.pages,
+            entry.copies,
+            entry.billing_code,
+            entry.host,
+            entry.job_name,
+            entry.media,
+            entry.sides,
+        )
+
+    def ingest_tuple(
+        self,
+        printer: str,
+        user: str,
+        job_id: int,
+        timestamp: datetime,
+        pages: int,
+        copies: int,
+        billing_code: str | None,
+        host: str | None,
+        job_name: str | None,
+        media: str | None,
+        sides: str | None,
+    ) -> None:
+        """Ingest one entry given as :data:`~printaudit.parser.LogRow`."""
+
+        totals = self.totals
+        totals.requests += 1
+        totals.pages += pages
+        # page_log is mostly chronological: usually only the first check
+        # runs. Both bounds are seeded from the first entry ingested.
+        if totals.requests == 1:
+            totals.first_event = totals.last_event = timestamp
+        elif timestamp > totals.last_event:
+            totals.last_event = timestamp
+        elif timestamp < totals.first_event:
+            totals.first_event = timestamp
 
         # Queue stats
-        self.queue_requests[entry.printer] += 1
-        self.queue_pages[entry.printer] += entry.pages
-        self.queue_user_pages[(entry.printer, entry.user)] += entry.pages
+        row = self.queue_usage[printer]
+        row[0] += 1
+        row[1] += pages
+        self.queue_user_pages[(printer, user)] += pages
 
         # User stats
-        self.user_requests[entry.user] += 1
-        self.user_pages[entry.user] += entry.pages
+        row = self.user_usage[user]
+        row[0] += 1
+        row[1] += pages
 
         # Temporal
-        hour_key = entry.timestamp.strftime("%H:00")
-        day_key = entry.timestamp.strftime("%Y-%m-%d")
-        self.hourly[hour_key] += 1
-        self.hourly_pages[hour_key] += entry.pages
-        self.daily[day_key] += 1
-        self.daily_pages[day_key] += entry.pages
+        hour_key = _HOUR_KEYS[timestamp.hour]
+        day = timestamp.date()
+        day_key = self._day_cache.get(day)
+        if day_key is None:
+            day_key = self._day_cache[day] = day.strftime("%Y-%m-%d")
+        row = self.hourly_usage[hour_key]
+        row[0] += 1
+        row[1] += pages
+        row = self.daily_usage[day_key]
+        row[0] += 1
+        row[1] += pages
 
         # Job / copy buckets
-        self.job_histogram[self._bucketize(entry.pages, JOB_BUCKETS)] += 1
-        self.copy_histogram[self._bucketize(entry.copies, COPY_BUCKETS)] += 1
+        self.job_pages[pages] += 1
+        self.job_copies[copies] += 1
 
         # Cost analysis
-        billing = entry.billing_code or self._infer_billing(entry)
+        billing = billing_code or self._infer_billing(
+            printer, user, host, job_name
+        )
         label = billing or "unassigned"
-        self.cost_pages[label] += entry.pages
-        self.cost_user_pages[label][entry.user] += entry.pages
-        self.cost_queue_pages[label][entry.printer] += entry.pages
+        self.cost_pages[label] += pages
+        self.cost_user_pages[(label, user)] += pages
+        self.cost_queue_pages[(label, printer)] += pages
 
         # Client analysis
-        client_label = entry.host or "unknown"
-        self.client_pages[client_label] += entry.pages
+        self.client_pages[host or "unknown"] += pages
 
         # Document types
-        doc_type = _document_extension(entry.job_name)
-        self.document_pages[doc_type] += entry.pages
+        self.document_pages[_document_extension(job_name)] += pages
 
         # Media / duplex
-        media_label = entry.media or "unknown"
-        self.media_pages[media_label] += entry.pages
-        duplex_label = normalize_duplex(entry.sides)
-        self.duplex_pages[duplex_label] += entry.pages
+        self.media_pages[media or "unknown"] += pages
+        self.duplex_pages[normalize_duplex(sides)] += pages
+
+    def ingest_batch(self, entries: Iterable[parser.LogEntry]) -> None:
+        """Ingest a stream of entries in a single pass."""
+
+        ingest = self.ingest
+        for entry in entries:
+            ingest(entry)
+
+    def ingest_rows(self, rows: Iterable[parser.LogRow]) -> None:
+        """Ingest a stream of :data:`~printaudit.parser.LogRow` tuples."""
+
+        ingest = self.ingest_tuple
+        for row in rows:
+            ingest(*row)
+
+    def merge(self, other: UsageAggregator) -> UsageAggregator:
+        """Fold another aggregator's counts into this one and return it.
+
+        Both aggregators are expected to share the same configuration;
+        merging partial results in log order keeps rankings identical to
+        a single serial pass.
+        """
 
-    def build_report(self) -> AnalysisReport:
         totals = self.totals
-        queue_stats = self._build_queue_stats()
-        queue_user_stats = sorted(
-            (
-                QueueUserStat(queue=q, user=u, pages=pages)
-                for (q, u), pages in self.queue_user_pages.items()
-            ),
-            key=lambda item: (-item.pages, item.queue, item.user),
+        totals.requests += other.totals.requests
+        totals.pages += other.totals.pages
+        for event in (other.totals.first_event, other.totals.last_event):
+            if event is None:
+                continue
+            if not totals.first_event or event < totals.first_event:
+                totals.first_event = event
+            if not totals.last_event or event > totals.last_event:
+                totals.last_event = event
+
+        for mine, theirs in (
+            (self.queue_usage, other.queue_usage),
+            (self.user_usage, other.user_usage),
+            (self.hourly_usage, other.hourly_usage),
+            (self.daily_usage, other.daily_usage),
+        ):
+            for key, (requests, pages) in theirs.items():
+                row = mine[key]
+                row[0] += requests
+                row[1] += pages
+
+        # Counter.update adds counts without dropping zero-page keys
+        self.queue_user_pages.update(other.queue_user_pages)
+        self.job_pages.update(other.job_pages)
+        self.job_copies.update(other.job_copies)
+        self.cost_pages.update(other.cost_pages)
+        self.cost_user_pages.update(other.cost_user_pages)
+        self.cost_queue_pages.update(other.cost_queue_pages)
+        self.client_pages.update(other.client_pages)
+        self.document_pages.update(other.document_pages)
+        self.media_pages.update(other.media_pages)
+        self.duplex_pages.update(other.duplex_pages)
+        return self
+
+    def build_report(
+        self,
+        limit: int | None = None,
+        enabled: Collection[str] | None = None,
+    ) -> AnalysisReport:
+        """Build the report; ``limit`` keeps only the top rows per ranking.
+
+        Totals, temporal, bucket and cost sections are never truncated.
+        When ``enabled`` is given, sections from :data:`REPORT_SECTIONS`
+        that it does not list are skipped and left empty; the implicit
+        media/client/document/duplex sections are always built.
+        """
+
+        def wanted(section: str) -> bool:
+            return enabled is None or section in enabled
+
+        totals = self.totals
+        queue_stats = self._build_queue_stats(limit) if wanted("queue") else []
+        queue_user_stats = (
+            self._build_queue_user_stats(limit) if wanted("queue_user") else []
         )
-        user_stats = self._build_user_stats()
+        user_stats = self._build_user_stats(limit) if wanted("user") else []
         hourly = []
-        for h in sorted(self.hourly.keys()):
-            hour_int = int(h.split(":", 1)[0])
-            within = self.work_start <= hour_int <= self.work_end
-            hourly.append(
+        daily = []
+        if wanted("temporal"):
+            for h, (requests, pages) in sorted(self.hourly_usage.items()):
+                hour_int = int(h.split(":", 1)[0])
+                within = self.work_start <= hour_int <= self.work_end
+                hourly.append(
+                    TemporalPoint(
+                        key=h,
+                        requests=requests,
+                        pages=pages,
+                        within_hours=within,
+                    )
+                )
+            daily = [
                 TemporalPoint(
-                    key=h,
-                    requests=self.hourly[h],
-                    pages=self.hourly_pages[h],
-                    within_hours=within,
+                    key=d,
+                    requests=requests,
+                    pages=pages,
+                    within_hours=None,
                 )
+                for d, (requests, pages) in sorted(self.daily_usage.items())
+            ]
+        job_buckets = []
+        copy_buckets = []
+        if wanted("job"):
+            job_buckets = self._build_bucket_section(
+                _histogram(self.job_pages, _bucketize_job)
             )
-        daily = [
-            TemporalPoint(
-                key=d,
-                requests=self.daily[d],
-                pages=self.daily_pages[d],
-                within_hours=None,
+            copy_buckets = self._build_bucket_section(
+                _histogram(self.job_copies, _bucketize_copy)
             )
-            for d in sorted(self.daily.keys())
-        ]
-        job_buckets = self._build_bucket_section(self.job_histogram)
-        copy_buckets = self._build_bucket_section(self.copy_histogram)
-        cost_stats = self._build_cost_stats()
-        client_stats = self._simple_stats(self.client_pages)
-        document_types = self._simple_stats(self.document_pages)
-        media_stats = self._simple_stats(self.media_pages)
-        duplex_stats = self._simple_stats(self.duplex_pages)
+        cost_stats = self._build_cost_stats() if wanted("cost") else []
+        client_stats = self._simple_stats(self.client_pages, limit)
+        document_types = self._simple_stats(self.document_pages, limit)
+        media_stats = self._simple_stats(self.media_pages, limit)
+        duplex_stats = self._simple_stats(self.duplex_pages, limit)
 
         return AnalysisReport(
             totals=totals,
@@ -277,12 +400,11 @@ class UsageAggregator:
             duplex_stats=duplex_stats,
         )
 
-    def _build_queue_stats(self) -> list[QueueStat]:
+    def _build_queue_stats(self, limit: int | None = None) -> list[QueueStat]:
         total_requests = max(self.totals.requests, 1)
         total_pages = max(self.totals.pages, 1)
         stats = []
-        for queue, pages in self.queue_pages.most_common():
-            requests = self.queue_requests[queue]
+        for queue, (requests, pages) in _rank_usage(self.queue_usage, limit):
             stats.append(
                 QueueStat(
                     queue=queue,
@@ -294,10 +416,26 @@ class UsageAggregator:
             )
         return stats
 
-    def _build_user_stats(self) -> list[UserStat]:
+    def _build_queue_user_stats(
+        self, limit: int | None = None
+    ) -> list[QueueUserStat]:
+        def rank(item: tuple[tuple[str, str], int]) -> tuple[int, str, str]:
+            (queue, user), pages = item
+            return -pages, queue, user
+
+        items = self.queue_user_pages.items()
+        if limit is None:
+            ranked = sorted(items, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, items, key=rank)
+        return [
+            QueueUserStat(queue=queue, user=user, pages=pages)
+            for (queue, user), pages in ranked
+        ]
+
+    def _build_user_stats(self, limit: int | None = None) -> list[UserStat]:
         stats = []
-        for user, pages in self.user_pages.most_common():
-            requests = self.user_requests[user]
+        for user, (requests, pages) in _rank_usage(self.user_usage, limit):
             ratio = pages / requests if requests else 0
             stats.append(
                 UserStat(
@@ -328,6 +466,10 @@ class UsageAggregator:
         return sorted(result, key=lambda b: b.label)
 
     def _build_cost_stats(self) -> list[CostStat]:
+        user_pages_by_label = _group_by_label(self.cost_user_pages)
+        queue_pages_by_label = _group_by_label(self.cost_queue_pages)
+        # Queues recur under several labels; lower-case each only once.
+        queue_rates: dict[str, float] = {}
         stats = []
         for label, pages in self.cost_pages.most_common():
             amount = 0.0
@@ -336,60 +478,60 @@ class UsageAggregator:
                 or self.cost_printer_rates
                 or self.cost_label_rates
             ):
-                queue_pages = self.cost_queue_pages[label]
-                for queue, q_pages in queue_pages.items():
-                    rate = self._resolve_rate(label, queue)
-                    amount += q_pages * rate
+                # A label rate applies to every queue; resolve it once.
+                label_rate = self._cost_label_rates_lc.get(label.lower())
+                if label_rate is not None:
+                    amount = pages * label_rate
+                else:
+                    printer_rates = self._cost_printer_rates_lc
+                    default = self.cost_default
+                    for queue, q_pages in queue_pages_by_label[label].items():
+                        rate = queue_rates.get(queue)
+                        if rate is None:
+                            rate = printer_rates.get(queue.lower(), default)
+                            queue_rates[queue] = rate
+                        amount += q_pages * rate
             stats.append(
                 CostStat(
                     label=label,
                     pages=pages,
-                    per_user=_top_items(self.cost_user_pages[label]),
-                    per_queue=_top_items(self.cost_queue_pages[label]),
+                    per_user=_top_items(user_pages_by_label[label]),
+                    per_queue=_top_items(queue_pages_by_label[label]),
                     amount=amount,
                 )
             )
         return stats
 
-    def _resolve_rate(self, label: str, queue: str) -> float:
-        """Determine effective rate for a given cost label and queue."""
-
-        label_key = label.lower()
-        queue_key = queue.lower()
-        if label_key in self.cost_label_rates:
-            return self.cost_label_rates[label_key]
-        if queue_key in self.cost_printer_rates:
-            return self.cost_printer_rates[queue_key]
-        return self.cost_default
-
-    def _simple_stats(self, counter: Counter[str]) -> list[SimpleStat]:
+    def _simple_stats(
+        self, counter: Counter[str], limit: int | None = None
+    ) -> list[SimpleStat]:
         return [
             SimpleStat(label=label, pages=pages)
-            for label, pages in counter.most_common()
+            for label, pages in counter.most_common(limit)
         ]
 
-    def _infer_billing(self, entry: parser.LogEntry) -> str | None:
-        if not self.cost_rules:
+    def _infer_billing(
+        self,
+        printer: str,
+        user: str,
+        host: str | None,
+        job_name: str | None,
+    ) -> str | None:
+        if not self._cost_rule_tokens:
             return None
-        haystack = " ".join(
-            filter(
-                None,
-                [
-                    entry.printer,
-                    entry.user,
-                    entry.job_name or "",
-                    entry.host or "",
-                ],
-            )
-        ).lower()
-        for label, raw_tokens in self.cost_rules.items():
-            tokens = [
-                token.strip().lower()
-                for token in re_splitter(raw_tokens)
-                if token.strip()
-            ]
-            if not tokens:
-                continue
+        # printer/user/host repeat heavily; only the job name varies.
+        key = (printer, user, host or "")
+        cached = self._haystack_cache.get(key)
+        if cached is None:
+            head = " ".join(filter(None, [printer, user]))
+            cached = (head.lower(), key[2].lower())
+            self._haystack_cache[key] = cached
+        haystack, host = cached
+        if job_name:
+            haystack = f"{haystack} {job_name.lower()}"
+        if host:
+            haystack = f"{haystack} {host}"
+        for label, tokens in self._cost_rule_tokens:
             if any(token in haystack for token in tokens):
                 return label
         return None
@@ -407,13 +549,52 @@ class UsageAggregator:
         return f">{buckets[-1][1]}" if buckets and buckets[-1][1] else "other"
 
 
+def _bucket_bounds(
+    buckets: Sequence[tuple[int | None, int | None, str]],
+) -> tuple[int, list[int], list[str]]:
+    """Flatten contiguous, ascending buckets into bisect-able bounds."""
+
+    low = buckets[0][0] or 0
+    uppers = [high for _, high, _ in buckets if high is not None]
+    labels = [label for _, _, label in buckets]
+    return low, uppers, labels
+
+
+_JOB_LOW, _JOB_UPPER, _JOB_LABELS = _bucket_bounds(JOB_BUCKETS)
+_COPY_LOW, _COPY_UPPER, _COPY_LABELS = _bucket_bounds(COPY_BUCKETS)
+
+
+def _histogram(
+    values: Counter[int], bucketize: Callable[[int], str]
+) -> Counter[str]:
+    # Labels keep first-seen order, as if bucketed while ingesting.
+    histogram: Counter[str] = Counter()
+    for value, count in values.items():
+        histogram[bucketize(value)] += count
+    return histogram
+
+
+def _bucketize_job(value: int) -> str:
+    if value < _JOB_LOW:
+        return "other"
+    return _JOB_LABELS[bisect_left(_JOB_UPPER, value)]
+
+
+def _bucketize_copy(value: int) -> str:
+    if value < _COPY_LOW:
+        return "other"
+    return _COPY_LABELS[bisect_left(_COPY_UPPER, value)]
+
+
+# Job names repeat heavily across a page_log and the helper is pure.
+@lru_cache(maxsize=4096)
 def _document_extension(name: str | None) -> str:
     if not name or name == "unknown":
         return "unknown"
-    lowered = name.lower()
-    if "." not in lowered:
+    _, dot, ext = name.rpartition(".")
+    if not dot:
         return "unknown"
-    ext = lowered.rsplit(".", 1)[-1]
+    ext = ext.lower()
     if ext not in COMMON_EXTENSIONS:
         return "unknown"
     return ext
@@ -471,9 +652,21 @@ COMMON_EXTENSIONS = {
 }
 
 
+# Canonical CUPS ``sides`` values, matched before any lowercasing
+_DUPLEX_LABELS = {
+    "one-sided": "simplex",
+    "simplex": "simplex",
+    "two-sided-long-edge": "duplex",
+    "two-sided-short-edge": "duplex",
+}
+
+
 def normalize_duplex(sides: str | None) -> str:
     if not sides:
         return "unknown"
+    label = _DUPLEX_LABELS.get(sides)
+    if label is not None:
+        return label
     value = sides.lower()
     if value.startswith("two-sided"):
         return "duplex"
@@ -486,11 +679,54 @@ def _top_items(counter: Counter[str], limit: int = 5) -> list[tuple[str, int]]:
     return counter.most_common(limit)
 
 
+def _usage() -> list[int]:
+    return [0, 0]
+
+
+def _usage_pages(item: tuple[str, list[int]]) -> int:
+    return item[1][1]
+
+
+def _rank_usage(
+    usage: dict[str, list[int]], limit: int | None = None
+) -> list[tuple[str, list[int]]]:
+    """Order usage rows by pages, descending, like Counter.most_common."""
+
+    if limit is None:
+        return sorted(usage.items(), key=_usage_pages, reverse=True)
+    return heapq.nlargest(limit, usage.items(), key=_usage_pages)
+
+
+def _compile_cost_rules(
+    cost_rules: dict[str, str],
+) -> list[tuple[str, tuple[str, ...]]]:
+    """Split and lowercase rule tokens once, dropping empty rules."""
+
+    compiled = []
+    for label, raw_tokens in cost_rules.items():
+        tokens = tuple(
+            token.strip().lower()
+            for token in re_splitter(raw_tokens)
+            if token.strip()
+        )
+        if tokens:
+            compiled.append((label, tokens))
+    return compiled
+
+
+def _group_by_label(
+    counter: Counter[tuple[str, str]],
+) -> DefaultDict[str, Counter[str]]:
+    grouped: DefaultDict[str, Counter[str]] = defaultdict(Counter)
+    for (label, key), pages in counter.items():
+        grouped[label][key] = pages
+    return grouped
+
+
+_RULE_DELIMITERS = str.maketrans({"|": ",", ";": ","})
+
+
 def re_splitter(raw: str) -> list[str]:
-    delimiters = [",", "|", ";"]
-    tokens = [raw]
-    for delim in delimiters:
-        tokens = [
-            subtoken for token in tokens for subtoken in token.split(delim)
-        ]
-    return tokens
+    """Split a rule value on any of ``,``, ``|`` or ``;``."""
+
+    return raw.translate(_RULE_DELIMITERS).split(",")
@@ -2,32 +2,45 @@
 
 from __future__ import annotations
 
+import configparser
+import copy
+import io
 import os
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 
 class ConfigError(RuntimeError):
     """Raised when the configuration file cannot be parsed or found."""
 
 
-DEFAULT_CONF_PATHS: list[Path] = [
+_SYSTEM_CONF_PATHS = (
     Path("/etc/printaudit/printaudit.conf"),
     Path("/etc/printaudit.conf"),
-    Path.cwd() / "printaudit.conf",
-]
+)
+
+_DISCOVERED_CONFIG: dict[tuple[str, ...], Path] = {}
+_CONFIG_CACHE: dict[tuple[str, int, int, int], Config] = {}
+# Options grouped by section, as read from one config file
+_Sections = dict[str, dict[str, str]]
+_RAW_CACHE: dict[str, tuple[tuple[int, int, int], _Sections]] = {}
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
 
 
 def _bool(value: str) -> bool:
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    # configparser already strips surrounding whitespace from values.
+    return value.lower() in _TRUTHY
 
 
 def _split_csv(raw: str) -> list[str]:
-    return [item.strip() for item in raw.split(",") if item.strip()]
+    return [item for item in map(str.strip, raw.split(",")) if item]
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailSettings:
     enabled: bool = False
     smtp_host: str = ""
@@ -43,7 +56,7 @@ class EmailSettings:
     from_address: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     page_log_path: Path = Path("/var/log/cups/page_log")
     work_start: int = 7
@@ -61,7 +74,10 @@ class Config:
     outputs: list[str] = field(default_factory=lambda: ["cli"])
     cli_mode: str = "rich"  # plain|rich
     cli_max_rows: int = 15
+    workers: int = 1
+    page_log_sorted: bool = False
     csv_dir: Path = Path("./reports")
+    csv_single_file: bool = False
     html_path: Path = Path("./reports/printaudit.html")
     html_use_chartjs: bool = False
     cost_inference_rules: dict[str, str] = field(default_factory=dict)
@@ -74,148 +90,248 @@ class Config:
     currency_code: str = ""
 
 
+# Section option → (attribute, caster) tables
+_OptionTable = Mapping[str, tuple[str, Callable[[str], Any]]]
+
+_CORE_OPTIONS: _OptionTable = {
+    "page_log_path": ("page_log_path", Path),
+    "work_start": ("work_start", int),
+    "work_end": ("work_end", int),
+    "enabled_sections": ("enabled_sections", _split_csv),
+    "outputs": ("outputs", _split_csv),
+    "cli_mode": ("cli_mode", str),
+    "cli_max_rows": ("cli_max_rows", int),
+    "workers": ("workers", int),
+    "page_log_sorted": ("page_log_sorted", _bool),
+    "csv_dir": ("csv_dir", Path),
+    "csv_single_file": ("csv_single_file", _bool),
+    "html_path": ("html_path", Path),
+    "html_use_chartjs": ("html_use_chartjs", _bool),
+}
+_COSTS_OPTIONS: _OptionTable = {
+    "default": ("cost_default", float),
+    "currency_symbol": ("currency_symbol", str),
+    "currency_code": ("currency_code", str),
+}
+_EMAIL_OPTIONS: _OptionTable = {
+    "enabled": ("enabled", _bool),
+    "smtp_host": ("smtp_host", str),
+    "smtp_port": ("smtp_port", int),
+    "smtp_user": ("smtp_user", str),
+    "smtp_password": ("smtp_password", str),
+    "use_tls": ("use_tls", _bool),
+    "recipients": ("recipients", _split_csv),
+    "attach_csv": ("attach_csv", _bool),
+    "attach_html": ("attach_html", _bool),
+    "report_in_body": ("report_in_body", _bool),
+    "subject": ("subject", str),
+    "from": ("from_address", str),
+    "from_address": ("from_address", str),
+}
+
+
+def _default_paths() -> list[Path]:
+    # The working directory is resolved per call, not frozen at import.
+    return [*_SYSTEM_CONF_PATHS, Path.cwd() / "printaudit.conf"]
+
+
 def discover_config_file(explicit_path: Path | None = None) -> Path:
-    """Return the first readable configuration file."""
+    """Return the first readable configuration file.
+
+    Successful lookups are memoized per candidate list, so repeated calls
+    in one process skip the probes of earlier candidates. The cached file
+    is re-checked on every call and dropped once it is gone; a
+    higher-priority file created later is found after
+    :func:`clear_config_cache`.
+    """
 
     candidates: Iterable[Path]
     if explicit_path:
         candidates = [explicit_path]
     else:
         env_path = os.getenv("PRINTAUDIT_CONFIG")
-        candidates = [Path(env_path)] if env_path else DEFAULT_CONF_PATHS
-
-    for candidate in candidates:
-        if candidate.is_file():
+        candidates = [Path(env_path)] if env_path else _default_paths()
+
+    key = tuple(os.fspath(candidate) for candidate in candidates)
+    found = _DISCOVERED_CONFIG.get(key)
+    if found is not None:
+        if os.path.isfile(found):
+            return found
+        del _DISCOVERED_CONFIG[key]
+
+    for candidate, raw_path in zip(candidates, key):
+        if os.path.isfile(raw_path):
+            _DISCOVERED_CONFIG[key] = candidate
             return candidate
 
     raise ConfigError(
-        "No configuration file found. Searched: "
-        + ", ".join(str(p) for p in candidates)
+        "No configuration file found. Searched: " + ", ".join(key)
     )
 
 
 def parse_config(path: Path | None = None) -> Config:
-    """Load configuration from disk (strictly section-based)."""
+    """Load configuration from disk (strictly section-based).
 
-    conf_path = discover_config_file(path)
-    raw = _read_config_file(conf_path)
-
-    config = Config()
-
-    # Simple key → attribute mappings
-    mappings = [
-        # [core]
-        ("core.page_log_path", "page_log_path", Path),
-        ("core.work_start", "work_start", int),
-        ("core.work_end", "work_end", int),
-        ("core.enabled_sections", "enabled_sections", _split_csv),
-        ("core.outputs", "outputs", _split_csv),
-        ("core.cli_mode", "cli_mode", str),
-        ("core.cli_max_rows", "cli_max_rows", int),
-        ("core.csv_dir", "csv_dir", Path),
-        ("core.html_path", "html_path", Path),
-        ("core.html_use_chartjs", "html_use_chartjs", _bool),
-        # [costs]
-        ("costs.default", "cost_default", float),
-        ("costs.currency_symbol", "currency_symbol", str),
-        ("costs.currency_code", "currency_code", str),
-    ]
-
-    for key, attr, caster in mappings:
-        if key in raw:
-            setattr(config, attr, caster(raw[key]))
-
-    _parse_cost_rates(config, raw)
-    _parse_cost_rules(config, raw)
-    _load_email_settings(config.email, raw)
-
-    return config
-
-
-def _load_email_settings(email: EmailSettings, raw: dict[str, str]) -> None:
-    mapping = {
-        "email.enabled": ("enabled", _bool),
-        "email.smtp_host": ("smtp_host", str),
-        "email.smtp_port": ("smtp_port", int),
-        "email.smtp_user": ("smtp_user", str),
-        "email.smtp_password": ("smtp_password", str),
-        "email.use_tls": ("use_tls", _bool),
-        "email.recipients": ("recipients", _split_csv),
-        "email.attach_csv": ("attach_csv", _bool),
-        "email.attach_html": ("attach_html", _bool),
-        "email.report_in_body": ("report_in_body", _bool),
-        "email.subject": ("subject", str),
-        "email.from": ("from_address", str),
-    }
-
-    for key, (attr, caster) in mapping.items():
-        if key in raw:
-            setattr(email, attr, caster(raw[key]))
-
-
-def _read_config_file(conf_path: Path) -> dict[str, str]:
-    """Read a config file into a flat key/value mapping with section keys."""
-
-    raw: dict[str, str] = {}
-    current_section: str | None = None
-
-    with conf_path.open("r", encoding="utf-8") as handle:
-        for lineno, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-
-            # Section header, e.g. [core], [email], [costs], [cost_rules]
-            if stripped.startswith("[") and stripped.endswith("]"):
-                name = stripped[1:-1].strip().lower()
-                current_section = name or None
-                continue
-
-            if "=" not in stripped:
-                raise ConfigError(
-                    f"Invalid config line {lineno} in {conf_path}: {line!r}"
-                )
-
-            if current_section is None:
-                raise ConfigError(
-                    f"Config key outside section at line {lineno} in "
-                    f"{conf_path}: {line!r}"
-                )
-
-            key, value = stripped.split("=", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
-            if current_section == "email":
-                full_key = f"email.{key}"
-            else:
-                full_key = f"{current_section}.{key}"
-
-            raw[full_key] = value
+    Parsed configs are cached by path, mtime, size and inode; callers get
+    a deep copy, so mutating the result never leaks into later calls.
+    """
 
+    conf_path = discover_config_file(path)
+    stat = _stat_config(conf_path)
+    key = (
+        os.path.abspath(conf_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,  # a replaced file may keep mtime and size (cp -p)
+    )
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = _CONFIG_CACHE[key] = _build_config(conf_path)
+    return copy.deepcopy(cached)
+
+
+def clear_config_cache() -> None:
+    """Forget parsed configs and discovered paths; re-read from disk."""
+
+    _CONFIG_CACHE.clear()
+    _RAW_CACHE.clear()
+    _DISCOVERED_CONFIG.clear()
+
+
+def _stat_config(conf_path: Path) -> os.stat_result:
+    try:
+        return conf_path.stat()
+    except OSError as exc:
+        raise ConfigError(
+            f"Cannot read config file {conf_path}: {exc}"
+        ) from exc
+
+
+def _read_config_file(conf_path: Path) -> _Sections:
+    """Return the file's options grouped by lower-cased section name.
+
+    The result is cached by (mtime, size, inode) and shared between
+    callers, so treat it as read-only.
+    """
+
+    stat = _stat_config(conf_path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = os.path.abspath(conf_path)
+    cached = _RAW_CACHE.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    try:
+        with conf_path.open("r", encoding="utf-8") as handle:
+            text = handle.read()
+    except OSError as exc:
+        raise ConfigError(
+            f"Cannot read config file {conf_path}: {exc}"
+        ) from exc
+    raw = _split_plain_sections(text)
+    if raw is None:
+        parser = configparser.RawConfigParser(strict=False)
+        parser.optionxform = str.lower
+        try:
+            parser.read_file(io.StringIO(text), source=os.fspath(conf_path))
+        except configparser.Error as exc:
+            raise ConfigError(
+                f"Invalid config file {conf_path}: {exc}"
+            ) from exc
+        raw = {
+            section: dict(parser.items(section))
+            for section in parser.sections()
+        }
+
+    sections: _Sections = {}
+    for section, options in raw.items():
+        sections.setdefault(section.strip().lower(), {}).update(options)
+    _RAW_CACHE[key] = (fingerprint, sections)
+    return sections
+
+
+def _split_plain_sections(text: str) -> _Sections | None:
+    """Parse the ``[section]`` / ``key=value`` subset of INI by hand.
+
+    Gives the same sections as ``RawConfigParser(strict=False)``, or
+    None at the first line outside that subset (indented or ``:``
+    lines, ``[DEFAULT]``, options before a header, ...) so the caller
+    can let configparser handle, or reject, the whole file.
+    """
+
+    raw: _Sections = {}
+    options: dict[str, str] | None = None
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if line[0].isspace():
+            return None  # may continue the previous value
+        if stripped[0] == "[":
+            header = stripped[1:-1]
+            if not header or stripped[-1] != "]" or header == "DEFAULT":
+                return None
+            options = raw.setdefault(header, {})
+            continue
+        name, equals, value = stripped.partition("=")
+        name = name.rstrip()
+        if options is None or not equals or not name or ":" in name:
+            return None
+        options[name.lower()] = value.lstrip()
     return raw
 
 
-def _parse_cost_rates(config: Config, raw: dict[str, str]) -> None:
-    """Parse printer and label cost rates from the [costs] section."""
+def _build_config(conf_path: Path) -> Config:
+    sections = _read_config_file(conf_path)
+    config = Config()
 
-    for key, value in raw.items():
-        if key.startswith("costs.printer."):
-            printer = key.replace("costs.printer.", "").lower()
-            if printer:
-                config.cost_printer_rates[printer] = float(value)
-        elif key.startswith("costs.label."):
-            label = key.replace("costs.label.", "").lower()
-            if label:
-                config.cost_label_rates[label] = float(value)
+    if "core" in sections:
+        _apply_options(config, sections["core"], _CORE_OPTIONS)
+    if "costs" in sections:
+        _load_costs(config, sections["costs"])
+    if "cost_rules" in sections:
+        config.cost_inference_rules.update(
+            (rule, tokens)
+            for rule, tokens in sections["cost_rules"].items()
+            if rule
+        )
+    if "email" in sections:
+        _apply_options(config.email, sections["email"], _EMAIL_OPTIONS)
 
+    return config
 
-def _parse_cost_rules(config: Config, raw: dict[str, str]) -> None:
-    """Parse cost inference rules from the [cost_rules] section only."""
 
-    prefix = "cost_rules."
-    for key, value in raw.items():
-        if key.startswith(prefix):
-            rule_name = key.replace(prefix, "")
-            if rule_name:
-                config.cost_inference_rules[rule_name] = value
+def _apply_options(
+    target: object, options: Mapping[str, str], table: _OptionTable
+) -> None:
+    for key, value in options.items():
+        spec = table.get(key)
+        if spec is not None:
+            attr, caster = spec
+            setattr(target, attr, _cast(key, caster, value))
+
+
+def _cast(key: str, caster: Callable[[str], Any], value: str) -> Any:
+    try:
+        return caster(value)
+    except ValueError as exc:
+        raise ConfigError(f"Invalid value for {key}: {value!r}") from exc
+
+
+def _load_costs(config: Config, options: Mapping[str, str]) -> None:
+    """Parse scalar settings and per-printer/label rates from [costs]."""
+
+    for key, value in options.items():
+        spec = _COSTS_OPTIONS.get(key)
+        if spec is not None:
+            attr, caster = spec
+            setattr(config, attr, _cast(key, caster, value))
+            continue
+        # Option names are already lower-cased by the parser.
+        kind, _, name = key.partition(".")
+        if not name:
+            continue
+        if kind == "printer":
+            config.cost_printer_rates[name] = _cast(key, float, value)
+        elif kind == "label":
+            config.cost_label_rates[name] = _cast(key, float, value)
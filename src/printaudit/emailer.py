@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import mimetypes
 import smtplib
 from collections.abc import Sequence
 from email.message import EmailMessage
@@ -19,6 +20,22 @@ class EmailClient:
 
     def __init__(self, settings: EmailSettings):
         self.settings = settings
+        self._server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> EmailClient:
+        """Open one SMTP session shared by every send in the block."""
+
+        self._server = self._connect()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except OSError:  # pragma: no cover - network dependent
+            server.close()
 
     def send_report(
         self,
@@ -47,30 +64,55 @@ class EmailClient:
         message.set_content(body)
 
         for path in attachments or []:
-            data = path.read_bytes()
-            message.add_attachment(
-                data,
-                maintype="application",
-                subtype="octet-stream",
-                filename=path.name,
-            )
+            maintype, subtype = _attachment_type(path)
+            with path.open("rb") as handle:
+                message.add_attachment(
+                    handle.read(),
+                    maintype=maintype,
+                    subtype=subtype,
+                    filename=path.name,
+                )
 
         self._send(message)
 
-    def _send(self, message: EmailMessage) -> None:
+    def _connect(self) -> smtplib.SMTP:
         try:
-            with smtplib.SMTP(
+            server = smtplib.SMTP(
                 self.settings.smtp_host or "localhost",
                 self.settings.smtp_port,
                 timeout=30,
-            ) as server:
-                if self.settings.use_tls:
-                    server.starttls()
-                if self.settings.smtp_user or self.settings.smtp_password:
-                    server.login(
-                        self.settings.smtp_user,
-                        self.settings.smtp_password,
-                    )
+            )
+        except OSError as exc:  # pragma: no cover - network dependent
+            raise EmailDeliveryError(str(exc)) from exc
+        try:
+            if self.settings.use_tls:
+                server.starttls()
+            if self.settings.smtp_user or self.settings.smtp_password:
+                server.login(
+                    self.settings.smtp_user,
+                    self.settings.smtp_password,
+                )
+        except OSError as exc:  # pragma: no cover - network dependent
+            server.close()
+            raise EmailDeliveryError(str(exc)) from exc
+        return server
+
+    def _send(self, message: EmailMessage) -> None:
+        try:
+            if self._server is not None:
+                self._server.send_message(message)
+                return
+            with self._connect() as server:
                 server.send_message(message)
         except OSError as exc:  # pragma: no cover - network dependent
             raise EmailDeliveryError(str(exc)) from exc
+
+
+def _attachment_type(path: Path) -> tuple[str, str]:
+    """Guess the MIME type so mail clients render CSV/HTML natively."""
+
+    mime, encoding = mimetypes.guess_type(path.name)
+    if mime is None or encoding is not None:
+        return "application", "octet-stream"
+    maintype, _, subtype = mime.partition("/")
+    return maintype, subtype
@@ -1,7 +1,9 @@
-"""Output module registry."""
+"""Output module registry.
+
+Built-in modules register themselves when first requested through
+:func:`get_output_module` or :func:`list_outputs`.
+"""
 
-# Ensure built-in modules register themselves
-from . import cli, csv_writer, email_sender, html_report  # noqa: F401
 from .base import OutputContext, OutputModule, get_output_module, list_outputs
 
 __all__ = [
@@ -4,21 +4,39 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from importlib import import_module
+from typing import TextIO
 
 from ..analysis import AnalysisReport
 from ..config import Config
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class OutputContext:
     config: Config
-    attachments: list[str] = field(default_factory=list)
-    stdout: object | None = None
+    attachments: list[str]
+    _stdout: TextIO | None
 
-    def __post_init__(self) -> None:
-        if self.stdout is None:
-            self.stdout = sys.stdout
+    def __init__(
+        self,
+        config: Config,
+        attachments: list[str] | None = None,
+        stdout: TextIO | None = None,
+    ) -> None:
+        self.config = config
+        self.attachments = [] if attachments is None else attachments
+        self._stdout = stdout
+
+    @property
+    def stdout(self) -> TextIO:
+        """Target stream; falls back to the *current* ``sys.stdout``."""
+
+        return self._stdout if self._stdout is not None else sys.stdout
+
+    @stdout.setter
+    def stdout(self, value: TextIO | None) -> None:
+        self._stdout = value
 
 
 class OutputModule(ABC):
@@ -33,24 +51,66 @@ class OutputModule(ABC):
 
 
 REGISTRY: dict[str, type[OutputModule]] = {}
+_SORTED_OUTPUTS: list[str] | None = None
 
 
 def register_output(name: str):
     def decorator(cls: type[OutputModule]) -> type[OutputModule]:
+        global _SORTED_OUTPUTS
+        existing = REGISTRY.get(name)
+        # Re-running the same class (e.g. a module reload) is fine; a
+        # second class would make dispatch depend on import order.
+        if existing is not None and _qualname(existing) != _qualname(cls):
+            raise ValueError(
+                f"Output '{name}' is already registered by "
+                f"{_qualname(existing)}"
+            )
         REGISTRY[name] = cls
+        _SORTED_OUTPUTS = None
         cls.name = name
         return cls
 
     return decorator
 
 
+def _qualname(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+# Built-in output name → submodule; imported on first use so a CLI-only
+# run never loads csv, smtplib or the HTML renderer.
+_BACKEND_MODULES = {
+    "cli": "cli",
+    "csv": "csv_writer",
+    "email": "email_sender",
+    "html": "html_report",
+}
+
+
+def _load_backend(name: str) -> None:
+    module = _BACKEND_MODULES.get(name)
+    if module is not None:
+        import_module(f".{module}", __package__)
+
+
 def get_output_module(name: str) -> type[OutputModule]:
-    if name not in REGISTRY:
+    cls = REGISTRY.get(name)
+    if cls is None:
+        _load_backend(name)
+        cls = REGISTRY.get(name)
+    if cls is None:
+        available = ", ".join(list_outputs())
         raise KeyError(
-            f"Unknown output module '{name}'. Available: {', '.join(REGISTRY)}"
+            f"Unknown output module '{name}'. Available: {available}"
         )
-    return REGISTRY[name]
+    return cls
 
 
 def list_outputs() -> list[str]:
-    return sorted(REGISTRY.keys())
+    global _SORTED_OUTPUTS
+    if _SORTED_OUTPUTS is None:
+        for name in _BACKEND_MODULES:
+            if name not in REGISTRY:
+                _load_backend(name)
+        _SORTED_OUTPUTS = sorted(REGISTRY)
+    return list(_SORTED_OUTPUTS)
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
-from textwrap import indent
+from collections.abc import Callable
+from io import StringIO
 
 from ..analysis import AnalysisReport
 from ..analysis.aggregator import TemporalPoint
 from .base import OutputModule, register_output
 
+# Section name → printer method, in display order.
+_SECTION_PRINTERS = (
+    ("queue", "_print_queue_section"),
+    ("queue_user", "_print_queue_user_section"),
+    ("user", "_print_user_section"),
+    ("temporal", "_print_temporal_section"),
+    ("job", "_print_job_section"),
+    ("cost", "_print_cost_section"),
+    ("media", "_print_media_section"),
+)
+_IMPLICIT_SECTIONS = frozenset({"media"})
+_QUEUE_USER_LINE = "  {:<20} {:<20} {:>6} pages\n"
+
 
 @register_output("cli")
 class CliOutput(OutputModule):
     """Plain or rich CLI report."""
 
     def render(self, report: AnalysisReport) -> None:
+        # Sections print into a buffer that reaches stdout in one write.
+        buffer = StringIO()
         mode = (self.context.config.cli_mode or "plain").lower()
         if mode == "rich":
-            self._render_rich(report)
+            self._render_rich(report, buffer)
         else:
-            self._render_plain(report)
+            self._render_plain(report, buffer)
+        self.context.stdout.write(buffer.getvalue())
 
-    def _render_plain(self, report: AnalysisReport) -> None:
-        out = self.context.stdout
+    def _render_plain(self, report: AnalysisReport, out) -> None:
         totals = report.totals
         print("EXECUTIVE SUMMARY", file=out)
         print(
@@ -30,15 +46,9 @@ class CliOutput(OutputModule):
             file=out,
         )
         print("", file=out)
-        self._print_queue_section(report, out, rich=False)
-        self._print_user_section(report, out, rich=False)
-        self._print_temporal_section(report, out, rich=False)
-        self._print_job_section(report, out, rich=False)
-        self._print_cost_section(report, out, rich=False)
-        self._print_media_section(report, out, rich=False)
+        self._print_sections(report, out, rich=False)
 
-    def _render_rich(self, report: AnalysisReport) -> None:
-        out = self.context.stdout
+    def _render_rich(self, report: AnalysisReport, out) -> None:
         totals = report.totals
         print("=" * 72, file=out)
         summary = (
@@ -53,12 +63,14 @@ class CliOutput(OutputModule):
         )
         print(totals_line, file=out)
         print("=" * 72, file=out)
-        self._print_queue_section(report, out, rich=True)
-        self._print_user_section(report, out, rich=True)
-        self._print_temporal_section(report, out, rich=True)
-        self._print_job_section(report, out, rich=True)
-        self._print_cost_section(report, out, rich=True)
-        self._print_media_section(report, out, rich=True)
+        self._print_sections(report, out, rich=True)
+
+    def _print_sections(self, report: AnalysisReport, out, rich: bool) -> None:
+        enabled = set(self.context.config.enabled_sections)
+        enabled.update(_IMPLICIT_SECTIONS)
+        for section, method in _SECTION_PRINTERS:
+            if section in enabled:
+                getattr(self, method)(report, out, rich)
 
     def _print_queue_section(
         self, report: AnalysisReport, out, rich: bool
@@ -80,14 +92,24 @@ class CliOutput(OutputModule):
             rows,
             rich,
         )
-        if report.queue_user_stats:
-            print("Queue-User breakdown:", file=out)
-            for item in report.queue_user_stats[:10]:
-                line = (
-                    f"{item.queue:<20} {item.user:<20} "
-                    f"{item.pages:>6} pages"
-                )
-                print(indent(line, "  "), file=out)
+        # A following queue-user breakdown closes the block instead.
+        if not (
+            report.queue_user_stats
+            and "queue_user" in self.context.config.enabled_sections
+        ):
+            print("", file=out)
+
+    def _print_queue_user_section(
+        self, report: AnalysisReport, out, rich: bool
+    ) -> None:
+        top = report.queue_user_stats[:10]
+        if not top:
+            return
+        line = _QUEUE_USER_LINE.format
+        out.write(
+            "Queue-User breakdown:\n"
+            + "".join(line(item.queue, item.user, item.pages) for item in top)
+        )
         print("", file=out)
 
     def _print_user_section(
@@ -152,11 +174,12 @@ class CliOutput(OutputModule):
         self, report: AnalysisReport, out, rich: bool
     ) -> None:
         print("COST ANALYSIS", file=out)
+        format_currency = self._currency_formatter()
         rows = [
             [
                 stat.label,
                 stat.pages,
-                self._format_currency(stat.amount),
+                format_currency(stat.amount),
                 ", ".join(f"{u}:{p}" for u, p in stat.per_user),
             ]
             for stat in report.cost_stats
@@ -166,15 +189,17 @@ class CliOutput(OutputModule):
         )
         print("", file=out)
 
-    def _format_currency(self, amount: float) -> str:
+    def _currency_formatter(self) -> Callable[[float], str]:
+        """Return an amount formatter bound to the configured currency."""
+
         config = self.context.config
-        symbol = getattr(config, "currency_symbol", "")
-        code = getattr(config, "currency_code", "")
+        symbol = config.currency_symbol
+        code = config.currency_code
         if symbol:
-            return f"{symbol}{amount:,.0f}"
+            return lambda amount: f"{symbol}{amount:,.0f}"
         if code:
-            return f"{amount:,.0f} {code}"
-        return f"{amount:,.2f}"
+            return lambda amount: f"{amount:,.0f} {code}"
+        return lambda amount: f"{amount:,.2f}"
 
     def _print_media_section(
         self, report: AnalysisReport, out, rich: bool
@@ -218,21 +243,19 @@ class CliOutput(OutputModule):
                 print(f"  ... ({len(rows)} rows)", file=out)
             return
 
+        str_rows = [[str(cell) for cell in row] for row in display_rows]
         widths = [len(header) for header in headers]
-        for row in display_rows:
+        for row in str_rows:
             for idx, cell in enumerate(row):
-                widths[idx] = max(widths[idx], len(str(cell)))
-
-        def fmt_row(row):
-            return " | ".join(
-                str(cell).ljust(widths[idx]) for idx, cell in enumerate(row)
-            )
+                if len(cell) > widths[idx]:
+                    widths[idx] = len(cell)
 
+        template = "  " + " | ".join(f"{{:<{width}}}" for width in widths)
         bar = "-+-".join("-" * width for width in widths)
-        print("  " + fmt_row(headers), file=out)
+        print(template.format(*headers), file=out)
         print("  " + bar, file=out)
-        for row in display_rows:
-            print("  " + fmt_row(row), file=out)
+        for row in str_rows:
+            print(template.format(*row), file=out)
         if limit is not None and len(rows) > limit:
             print(f"  ... ({len(rows)} rows)", file=out)
 
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import csv
+import os
+import re
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
 
 from ..analysis import AnalysisReport
 from .base import OutputModule, register_output
 
+# Characters that force csv.writer to quote a field (besides ",")
+_QUOTED_CHARS = re.compile(r'["\r\n]')
+
 
 @register_output("csv")
 class CsvOutput(OutputModule):
@@ -21,13 +28,13 @@ class CsvOutput(OutputModule):
                 "queue",
                 ["queue", "requests_pct", "pages_pct", "requests", "pages"],
                 (
-                    [
+                    (
                         stat.queue,
                         stat.requests_pct,
                         stat.pages_pct,
                         stat.requests,
                         stat.pages,
-                    ]
+                    )
                     for stat in report.queue_stats
                 ),
             ),
@@ -35,7 +42,7 @@ class CsvOutput(OutputModule):
                 "queue_user",
                 ["queue", "user", "pages"],
                 (
-                    [stat.queue, stat.user, stat.pages]
+                    (stat.queue, stat.user, stat.pages)
                     for stat in report.queue_user_stats
                 ),
             ),
@@ -43,12 +50,12 @@ class CsvOutput(OutputModule):
                 "users",
                 ["user", "requests", "pages", "pages_per_request"],
                 (
-                    [
+                    (
                         stat.user,
                         stat.requests,
                         stat.pages,
                         stat.pages_per_request,
-                    ]
+                    )
                     for stat in report.user_stats
                 ),
             ),
@@ -56,11 +63,11 @@ class CsvOutput(OutputModule):
                 "hourly",
                 ["hour", "requests", "pages"],
                 (
-                    [
+                    (
                         point.key,
                         point.requests,
                         point.pages,
-                    ]
+                    )
                     for point in report.hourly
                 ),
             ),
@@ -68,11 +75,11 @@ class CsvOutput(OutputModule):
                 "daily",
                 ["date", "requests", "pages"],
                 (
-                    [
+                    (
                         point.key,
                         point.requests,
                         point.pages,
-                    ]
+                    )
                     for point in report.daily
                 ),
             ),
@@ -80,7 +87,7 @@ class CsvOutput(OutputModule):
                 "job_buckets",
                 ["bucket", "pct_requests", "requests"],
                 (
-                    [bucket.label, bucket.pct_requests, bucket.request_count]
+                    (bucket.label, bucket.pct_requests, bucket.request_count)
                     for bucket in report.job_buckets
                 ),
             ),
@@ -88,7 +95,7 @@ class CsvOutput(OutputModule):
                 "copy_buckets",
                 ["bucket", "pct_requests", "requests"],
                 (
-                    [bucket.label, bucket.pct_requests, bucket.request_count]
+                    (bucket.label, bucket.pct_requests, bucket.request_count)
                     for bucket in report.copy_buckets
                 ),
             ),
@@ -96,40 +103,55 @@ class CsvOutput(OutputModule):
                 "cost",
                 ["label", "pages", "amount", "top_users", "top_queues"],
                 (
-                    [
+                    (
                         stat.label,
                         stat.pages,
                         stat.amount,
                         ";".join(f"{u}:{p}" for u, p in stat.per_user),
                         ";".join(f"{q}:{p}" for q, p in stat.per_queue),
-                    ]
+                    )
                     for stat in report.cost_stats
                 ),
             ),
             (
                 "clients",
                 ["client", "pages"],
-                ([stat.label, stat.pages] for stat in report.client_stats),
+                ((stat.label, stat.pages) for stat in report.client_stats),
             ),
             (
                 "document_types",
                 ["extension", "pages"],
-                ([stat.label, stat.pages] for stat in report.document_types),
+                ((stat.label, stat.pages) for stat in report.document_types),
             ),
             (
                 "media",
                 ["media", "pages"],
-                ([stat.label, stat.pages] for stat in report.media_stats),
+                ((stat.label, stat.pages) for stat in report.media_stats),
             ),
             (
                 "duplex",
                 ["mode", "pages"],
-                ([stat.label, stat.pages] for stat in report.duplex_stats),
+                ((stat.label, stat.pages) for stat in report.duplex_stats),
             ),
         ]
 
-        for name, headers, rows in writers:
-            self._write_csv(target / f"{name}.csv", headers, rows)
+        if self.context.config.csv_single_file:
+            path = target / "report.csv"
+            self._write_single_csv(path, writers)
+            self.context.attachments.append(str(path))
+            return
+
+        # Files are independent; overlap their writes on a few threads.
+        paths = [target / f"{name}.csv" for name, _, _ in writers]
+        workers = min(len(writers), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._write_csv, path, headers, rows)
+                for path, (_, headers, rows) in zip(paths, writers)
+            ]
+            for future in futures:
+                future.result()
+        self.context.attachments.extend(str(path) for path in paths)
 
     def _write_csv(
         self,
@@ -137,8 +159,49 @@ class CsvOutput(OutputModule):
         headers: Sequence[str],
         rows: Iterable[Sequence],
     ) -> None:
-        with path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(headers)
-            writer.writerows(rows)
-        self.context.attachments.append(str(path))
+        lines = [_csv_line(headers)]
+        lines.extend(map(_csv_line, rows))
+        _write_lines(path, lines)
+
+    def _write_single_csv(
+        self,
+        path: Path,
+        writers: Iterable[tuple[str, Sequence[str], Iterable[Sequence]]],
+    ) -> None:
+        """Write every table to one file, keyed by a leading section column.
+
+        Each table starts with its own header row (``section,<headers>``).
+        """
+
+        lines: list[str] = []
+        for name, headers, rows in writers:
+            lines.append(_csv_line(("section", *headers)))
+            lines.extend(_csv_line((name, *row)) for row in rows)
+        _write_lines(path, lines)
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    # Encode once; a large write bypasses the buffer in one syscall.
+    data = "".join(line + "\r\n" for line in lines).encode("utf-8")
+    with path.open("wb") as handle:
+        handle.write(data)
+
+
+def _csv_line(row: Sequence) -> str:
+    """Format one row exactly as the default ``csv.writer`` dialect would.
+
+    Report cells are numbers and plain names, so a join is almost always
+    enough; rows with a delimiter, quote or newline go through ``csv``.
+    """
+
+    cells = [str(cell) for cell in row]
+    line = ",".join(cells)
+    if (
+        line
+        and line.count(",") == len(cells) - 1
+        and not _QUOTED_CHARS.search(line)
+    ):
+        return line
+    buffer = StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()[:-2]
@@ -40,15 +40,20 @@ class EmailOutput(OutputModule):
             print(f"[printaudit] email delivery failed: {exc}")
 
     def _select_attachments(self) -> list[Path]:
-        paths = [Path(p) for p in self.context.attachments]
         settings = self.context.config.email
-        selected: list[Path] = []
-        for path in paths:
-            if path.suffix == ".csv" and settings.attach_csv:
-                selected.append(path)
-            if path.suffix in {".htm", ".html"} and settings.attach_html:
-                selected.append(path)
-        return selected
+        suffixes: tuple[str, ...] = ()
+        if settings.attach_csv:
+            suffixes += (".csv",)
+        if settings.attach_html:
+            suffixes += (".htm", ".html")
+        if not suffixes:
+            return []
+        # Match on the raw strings; only selected files become Paths.
+        return [
+            Path(path)
+            for path in self.context.attachments
+            if path.endswith(suffixes)
+        ]
 
     def _render_cli_output(self, report: AnalysisReport) -> str:
         buffer = StringIO()
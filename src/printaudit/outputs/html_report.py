@@ -3,13 +3,42 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterable
+from dataclasses import asdict
 from datetime import datetime
+from html import escape
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from ..analysis import AnalysisReport
 from .base import OutputModule, register_output
 
+# Non-ASCII is left as-is (the page is UTF-8) so both encoders below
+# emit the same blob.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _load_fast_dumps() -> Callable[[Any], bytes] | None:
+    # orjson is optional (``pip install printaudit[fast]``).
+    try:
+        from orjson import dumps
+    except ImportError:
+        return None
+    return dumps
+
+
+_FAST_DUMPS = _load_fast_dumps()
+
+# Table columns, in display order, pulled straight off the report stats
+_QUEUE_ROW = attrgetter(
+    "queue", "requests_pct", "pages_pct", "requests", "pages"
+)
+_USER_ROW = attrgetter("user", "requests", "pages", "pages_per_request")
+_BUCKET_ROW = attrgetter("label", "pct_requests", "request_count")
+_COST_ROW = attrgetter("label", "pages", "amount", "per_user", "per_queue")
+_SIMPLE_ROW = attrgetter("label", "pages")
+
 
 @register_output("html")
 class HtmlOutput(OutputModule):
@@ -17,11 +46,13 @@ class HtmlOutput(OutputModule):
         path = Path(self.context.config.html_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        template = self._build_template(report)
-        path.write_text(template, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as handle:
+            self._write_report(report, handle)
         self.context.attachments.append(str(path))
 
-    def _build_template(self, report: AnalysisReport) -> str:
+    def _write_report(self, report: AnalysisReport, handle: TextIO) -> None:
+        """Write the page section by section instead of as one big string."""
+
         totals = report.totals
         summary = {
             "requests": totals.requests,
@@ -29,86 +60,212 @@ class HtmlOutput(OutputModule):
             "start": _fmt_dt(totals.first_event),
             "end": _fmt_dt(totals.last_event),
         }
+        # Only what the chart scripts read goes into the inline JSON: the
+        # top ten queues and the hourly series. The tables above carry
+        # the rest, so the blob no longer grows with users or days.
         data = {
-            "queue": [vars(stat) for stat in report.queue_stats],
-            "users": [vars(stat) for stat in report.user_stats],
-            "hourly": [vars(point) for point in report.hourly],
-            "daily": [vars(point) for point in report.daily],
-            "job_buckets": [vars(bucket) for bucket in report.job_buckets],
-            "copy_buckets": [vars(bucket) for bucket in report.copy_buckets],
-            "cost": [
-                {
-                    "label": stat.label,
-                    "pages": stat.pages,
-                    "amount": stat.amount,
-                    "per_user": stat.per_user,
-                    "per_queue": stat.per_queue,
-                }
-                for stat in report.cost_stats
-            ],
-            "clients": [vars(stat) for stat in report.client_stats],
-            "document_types": [vars(stat) for stat in report.document_types],
-            "media": [vars(stat) for stat in report.media_stats],
-            "duplex": [vars(stat) for stat in report.duplex_stats],
+            "queue": [asdict(stat) for stat in report.queue_stats[:10]],
+            "hourly": [asdict(point) for point in report.hourly],
         }
-        data_json = json.dumps(data)
-
         row_limit = self.context.config.cli_max_rows
 
+        write = handle.write
+        write(_HTML_HEAD)
+        write(
+            f"""  <h1>PrintAudit Executive Summary</h1>
+  <p>Requests: {summary["requests"]} | Pages: {summary["pages"]} | Window: {summary["start"]} → {summary["end"]}</p>
+
+"""  # noqa: E501,E231
+        )
+        write(
+            f"""  <section>
+    <h2>Queue Analysis</h2>
+    <div class="chart-container">
+      <canvas id="queueChart"></canvas>
+    </div>
+    {self._table_html(["Queue", "%Req", "%Pages", "Req", "Pages"], map(_QUEUE_ROW, report.queue_stats[:10]))}
+  </section>
+
+"""  # noqa: E501,E231
+        )
+        write(
+            f"""  <section>
+    <h2>User Analysis</h2>
+    {self._table_html(["User","Requests","Pages","Pages/Request"], map(_USER_ROW, report.user_stats[:row_limit]))}
+  </section>
+
+"""  # noqa: E501,E231
+        )
+        write(
+            """  <section>
+    <h2>Temporal Analysis</h2>
+    <div class="chart-container">
+      <canvas id="hourlyChart"></canvas>
+    </div>
+  </section>
+
+"""
+        )
+        write(
+            f"""  <section>
+    <h2>Job & Copy Distribution</h2>
+    {self._table_html(["Bucket","% Requests","Requests"], map(_BUCKET_ROW, report.job_buckets))}
+    <h3>Copies</h3>
+    {self._table_html(["Bucket","% Requests","Requests"], map(_BUCKET_ROW, report.copy_buckets))}
+  </section>
+
+"""  # noqa: E501,E231
+        )
+        write(
+            f"""  <section>
+    <h2>Cost Analysis</h2>
+    {self._table_html(["Label","Pages","Amount","Top Users","Top Queues"], map(_COST_ROW, report.cost_stats))}
+  </section>
+
+"""  # noqa: E501,E231
+        )
+        write(
+            f"""  <section>
+    <h2>Media & Clients</h2>
+    {self._table_html(["Media","Pages"], map(_SIMPLE_ROW, report.media_stats))}
+    <h3>Clients</h3>
+    {self._table_html(["Client","Pages"], map(_SIMPLE_ROW, report.client_stats[:row_limit]))}
+    <h3>Document Types</h3>
+    {self._table_html(["Extension","Pages"], map(_SIMPLE_ROW, report.document_types))}
+    <h3>Duplex</h3>
+    {self._table_html(["Mode","Pages"], map(_SIMPLE_ROW, report.duplex_stats))}
+  </section>
+
+"""  # noqa: E501,E231
+        )
         # Choose chart implementation: external Chart.js or built-in canvas.
         if getattr(self.context.config, "html_use_chartjs", False):
-            charts_block = f"""
+            script_head, script_tail = _CHARTJS_SCRIPT
+        else:
+            script_head, script_tail = _CANVAS_SCRIPT
+        write(script_head)
+        # Compact separators keep the inline blob small; escaping "</"
+        # stops a name from closing the <script> element early.
+        write(_json_dumps(data).replace("</", "<\\/"))
+        write(script_tail)
+        write("\n</body>\n</html>\n")
+
+    def _table_html(
+        self, headers: list[str], rows: Iterable[tuple[Any, ...]]
+    ) -> str:
+        body = "".join(
+            "<tr>"
+            + "".join(f"<td>{_fmt_cell(cell)}</td>" for cell in row)
+            + "</tr>"
+            for row in rows
+        )
+        if not body:
+            return "<p>(no data)</p>"
+        head = "".join(f"<th>{escape(header)}</th>" for header in headers)
+        return (
+            f"<table><thead><tr>{head}</tr></thead>"
+            f"<tbody>{body}</tbody></table>"
+        )
+
+
+def _json_dumps(data: Any) -> str:
+    if _FAST_DUMPS is not None:
+        return _FAST_DUMPS(data).decode("utf-8")
+    return _JSON_ENCODER.encode(data)
+
+
+def _fmt_cell(value: Any) -> str:
+    """Render one table cell as escaped text; pairs show as ``a:b``."""
+
+    if isinstance(value, list):
+        if value and isinstance(value[0], (list, tuple)):
+            value = ", ".join(f"{a}:{b}" for a, b in value)
+        else:
+            value = ", ".join(str(item) for item in value)
+    return escape(str(value))
+
+
+def _fmt_dt(value: datetime | None) -> str:
+    if not value:
+        return "-"
+    return value.date().isoformat()
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <title>PrintAudit Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 2rem; background:#f5f5f5; }
+    section { margin-bottom: 2rem; background:#fff; padding:1rem 1.5rem; border-radius:8px; box-shadow:0 1px 3px rgba(0,0,0,0.1); }
+    table { width:100%; border-collapse:collapse; margin-top:1rem; }
+    th, td { text-align:left; padding:0.35rem 0.5rem; border-bottom:1px solid #ddd; }
+    h1 { margin-bottom:0; }
+    .chart-container { position:relative; width:100%; height:200px; }
+    canvas { display:block; width:100%; max-width:100%; height:100%; }
+  </style>
+</head>
+<body>
+"""  # noqa: E501
+
+# Inline chart scripts, split around the JSON data blob
+_CHARTJS_SCRIPT = (
+    """
   <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
   <script>
-    const data = {data_json};
-    document.addEventListener('DOMContentLoaded', function() {{
+    const data = """,
+    """;
+    document.addEventListener('DOMContentLoaded', function() {
       const queueCtx = document.getElementById('queueChart');
-      if (queueCtx) {{
-        new Chart(queueCtx, {{
+      if (queueCtx) {
+        new Chart(queueCtx, {
           type: 'bar',
-          data: {{
+          data: {
             labels: data.queue.slice(0, 10).map(row => row.queue),
-            datasets: [{{
+            datasets: [{
               label: 'Pages',
               data: data.queue.slice(0, 10).map(row => row.pages),
               backgroundColor: '#4a90e2'
-            }}]
-          }},
-          options: {{
+            }]
+          },
+          options: {
             responsive: true,
             maintainAspectRatio: false,
-            plugins: {{ legend: {{ display: false }} }}
-          }}
-        }});
-      }}
+            plugins: { legend: { display: false } }
+          }
+        });
+      }
 
       const hourlyCtx = document.getElementById('hourlyChart');
-      if (hourlyCtx) {{
-        new Chart(hourlyCtx, {{
+      if (hourlyCtx) {
+        new Chart(hourlyCtx, {
           type: 'bar',
-          data: {{
+          data: {
             labels: data.hourly.map(point => point.key),
-            datasets: [{{
+            datasets: [{
               label: 'Pages',
               data: data.hourly.map(point => point.pages),
               backgroundColor: '#36a2eb'
-            }}]
-          }},
-          options: {{
+            }]
+          },
+          options: {
             responsive: true,
             maintainAspectRatio: false,
-            plugins: {{ legend: {{ display: false }} }}
-          }}
-        }});
-      }}
-    }});
-  </script>"""
-        else:
-            charts_block = f"""
+            plugins: { legend: { display: false } }
+          }
+        });
+      }
+    });
+  </script>""",
+)
+_CANVAS_SCRIPT = (
+    """
   <script>
-    const data = {data_json};
+    const data = """,
+    """;
 
-    function drawBarChart(ctxId, labels, values) {{
+    function drawBarChart(ctxId, labels, values) {
       const canvas = document.getElementById(ctxId);
       if (!canvas || !labels.length) return;
 
@@ -121,11 +278,11 @@ class HtmlOutput(OutputModule):
       const displayHeight = Math.floor((rect.height || 160) * dpr);
 
       // Resize internal buffer if needed, then scale to DPR
-      if (canvas.width !== displayWidth || canvas.height !== displayHeight) {{
+      if (canvas.width !== displayWidth || canvas.height !== displayHeight) {
         canvas.width = displayWidth;
         canvas.height = displayHeight;
         ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
-      }}
+      }
 
       const cssWidth = rect.width || 600;
       const cssHeight = rect.height || 160;
@@ -142,14 +299,14 @@ class HtmlOutput(OutputModule):
       ctx.font = baseFontSize + 'px sans-serif';
 
       let labelStep = 1;
-      if (barWidth < 25) {{
+      if (barWidth < 25) {
         labelStep = 2;  // show every 2nd label on narrow layouts
-      }}
-      if (barWidth < 12) {{
+      }
+      if (barWidth < 12) {
         labelStep = 3;  // show every 3rd label on very narrow layouts
-      }}
+      }
 
-      labels.forEach((label, index) => {{
+      labels.forEach((label, index) => {
         const value = values[index];
         const barHeight = (value / maxVal) * (cssHeight - 28);
         const x = index * barWidth + 4;
@@ -159,28 +316,28 @@ class HtmlOutput(OutputModule):
         ctx.fillRect(x, y, barWidth - 8, barHeight);
 
         // Optionally skip some labels to avoid overlap
-        if (index % labelStep !== 0) {{
+        if (index % labelStep !== 0) {
           return;
-        }}
+        }
 
         // Draw label centered under the bar (no rotation)
         const maxLabelWidth = barWidth - 8;
         let text = label;
         while (text.length > 0 &&
-               ctx.measureText(text).width > maxLabelWidth) {{
+               ctx.measureText(text).width > maxLabelWidth) {
           text = text.slice(0, -1);
-        }}
-        if (text !== label && text.length > 1) {{
+        }
+        if (text !== label && text.length > 1) {
           text = text.slice(0, -1) + "…";
-        }}
+        }
         const textWidth = ctx.measureText(text).width;
         const textX = x + (barWidth - 8 - textWidth) / 2;
         const textY = cssHeight - 15;
         ctx.fillText(text, textX, textY);
-      }});
-    }}
+      });
+    }
 
-    document.addEventListener('DOMContentLoaded', function() {{
+    document.addEventListener('DOMContentLoaded', function() {
       const queueLabels = data.queue.slice(0, 10).map(row => row.queue);
       const queuePages = data.queue.slice(0, 10).map(row => row.pages);
       drawBarChart('queueChart', queueLabels, queuePages);
@@ -188,102 +345,6 @@ class HtmlOutput(OutputModule):
       const hourlyLabels = data.hourly.map(point => point.key);
       const hourlyPages = data.hourly.map(point => point.pages);
       drawBarChart('hourlyChart', hourlyLabels, hourlyPages);
-    }});
-  </script>"""
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <title>PrintAudit Report</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 2rem; background:#f5f5f5; }}
-    section {{ margin-bottom: 2rem; background:#fff; padding:1rem 1.5rem; border-radius:8px; box-shadow:0 1px 3px rgba(0,0,0,0.1); }}
-    table {{ width:100%; border-collapse:collapse; margin-top:1rem; }}
-    th, td {{ text-align:left; padding:0.35rem 0.5rem; border-bottom:1px solid #ddd; }}
-    h1 {{ margin-bottom:0; }}
-    .chart-container {{ position:relative; width:100%; height:200px; }}
-    canvas {{ display:block; width:100%; max-width:100%; height:100%; }}
-  </style>
-</head>
-<body>
-  <h1>PrintAudit Executive Summary</h1>
-  <p>Requests: {summary["requests"]} | Pages: {summary["pages"]} | Window: {summary["start"]} → {summary["end"]}</p>
-
-  <section>
-    <h2>Queue Analysis</h2>
-    <div class="chart-container">
-      <canvas id="queueChart"></canvas>
-    </div>
-    {self._table_html(["Queue", "%Req", "%Pages", "Req", "Pages"], data["queue"][:10], ["queue","requests_pct","pages_pct","requests","pages"])}
-  </section>
-
-  <section>
-    <h2>User Analysis</h2>
-    {self._table_html(["User","Requests","Pages","Pages/Request"], data["users"][:row_limit], ["user","requests","pages","pages_per_request"])}
-  </section>
-
-  <section>
-    <h2>Temporal Analysis</h2>
-    <div class="chart-container">
-      <canvas id="hourlyChart"></canvas>
-    </div>
-  </section>
-
-  <section>
-    <h2>Job & Copy Distribution</h2>
-    {self._table_html(["Bucket","% Requests","Requests"], data["job_buckets"], ["label","pct_requests","request_count"])}
-    <h3>Copies</h3>
-    {self._table_html(["Bucket","% Requests","Requests"], data["copy_buckets"], ["label","pct_requests","request_count"])}
-  </section>
-
-  <section>
-    <h2>Cost Analysis</h2>
-    {self._table_html(["Label","Pages","Amount","Top Users","Top Queues"], data["cost"], ["label","pages","amount","per_user","per_queue"])}
-  </section>
-
-  <section>
-    <h2>Media & Clients</h2>
-    {self._table_html(["Media","Pages"], data["media"], ["label","pages"])}
-    <h3>Clients</h3>
-    {self._table_html(["Client","Pages"], data["clients"][:row_limit], ["label","pages"])}
-    <h3>Document Types</h3>
-    {self._table_html(["Extension","Pages"], data["document_types"], ["label","pages"])}
-    <h3>Duplex</h3>
-    {self._table_html(["Mode","Pages"], data["duplex"], ["label","pages"])}
-  </section>
-
-{charts_block}
-</body>
-</html>
-"""  # noqa: E501,E231
-
-    def _table_html(
-        self, headers: list[str], rows: list[dict[str, Any]], keys: list[str]
-    ) -> str:
-        if not rows:
-            return "<p>(no data)</p>"
-        head = "".join(f"<th>{header}</th>" for header in headers)
-        body_rows = []
-        for row in rows:
-            cells = []
-            for key in keys:
-                value = row.get(key, "")
-                if isinstance(value, list):
-                    if value and isinstance(value[0], (list, tuple)):
-                        value = ", ".join(f"{a}:{b}" for a, b in value)
-                    else:
-                        value = ", ".join(str(item) for item in value)
-                cells.append(f"<td>{value}</td>")
-            body_rows.append("<tr>" + "".join(cells) + "</tr>")
-        body = "".join(body_rows)
-        return (
-            f"<table><thead><tr>{head}</tr></thead>"
-            f"<tbody>{body}</tbody></table>"
-        )
-
-
-def _fmt_dt(value: datetime | None) -> str:
-    if not value:
-        return "-"
-    return value.date().isoformat()
+    });
+  </script>""",
+)
@@ -3,31 +3,48 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial
+from itertools import starmap
 from pathlib import Path
+from sys import intern
 
 LOGGER = logging.getLogger(__name__)
 DATE_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
-
-
-LINE_HEADER = re.compile(
-    r"""
-    ^
-    (?P<printer>\S+)\s+
-    (?P<user>\S+)\s+
-    (?P<job_id>\d+)\s+
-    \[(?P<timestamp>[^\]]+)\]\s+
-    (?P<rest>.+)
-    $
-    """,
-    re.VERBOSE,
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+# normalize_billing's empty markers, for tokens that need no strip()
+_NO_BILLING = frozenset({"-", "-none-"})
+# Characters (bytes, for ranges) per regex scan; bounds memory on
+# multi-GB page_logs.
+_BLOCK_CHARS = 1 << 22
+# Parallel parsing/aggregation: spans below PARALLEL_MIN_BYTES stay in
+# one process; parse_page_log_parallel cuts larger files into ranges of
+# about _PARALLEL_RANGE_BYTES per task.
+PARALLEL_MIN_BYTES = 10 << 20
+_PARALLEL_RANGE_BYTES = 1 << 24
+# One page_log row in either layout, single-space separated. Anything
+# else this misses goes through the split()-based per-line parser.
+_FAST_LINE = re.compile(
+    r"^(\S+) (\S+) (\d+) \[([^\]\n]+)\] "
+    r"(?:total (\d+) (\S+) (\S+) (\S+(?: \S+)*?) (\S+) (\S+)"
+    r"|(\d+) (\d+) (\S+)(?: [^\n]*)?)\r?$",
+    re.MULTILINE,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     printer: str
     user: str
@@ -40,64 +57,542 @@ class LogEntry:
     job_name: str | None
     media: str | None
     sides: str | None
-    raw: str
+    # Original log line; not kept by the parser (it would double the
+    # memory held per entry), available for callers building entries.
+    raw: str | None = None
+
+
+# LogEntry fields in declaration order, minus ``raw``
+LogRow = tuple[
+    str,
+    str,
+    int,
+    datetime,
+    int,
+    int,
+    str | None,
+    str | None,
+    str | None,
+    str | None,
+    str | None,
+]
+
+
+def parse_page_log(
+    path: Path,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[LogEntry]:
+    """Yield normalized :class:`LogEntry` rows from a page_log file.
+
+    When ``start_date``/``end_date`` are given, only entries whose local
+    date falls in that inclusive window are yielded; other lines are
+    dropped right after the header split, before any further parsing.
+    """
 
+    return starmap(LogEntry, parse_page_log_tuples(path, start_date, end_date))
 
-def parse_page_log(path: Path) -> Iterator[LogEntry]:
-    """Yield normalized :class:`LogEntry` rows from a page_log file."""
+
+def parse_page_log_tuples(
+    path: Path,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[LogRow]:
+    """Like :func:`parse_page_log`, but yield plain :data:`LogRow` tuples.
+
+    Skips building a :class:`LogEntry` per line; feed the rows to
+    ``UsageAggregator.ingest_rows``.
+    """
 
     with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            line = line.rstrip("\n")
-            if not line:
-                continue
+        blocks = iter(partial(handle.read, _BLOCK_CHARS), "")
+        yield from _parse_blocks(_whole_lines(blocks), start_date, end_date)
+
+
+def parse_page_log_range(
+    path: Path,
+    start: int,
+    end: int,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[LogEntry]:
+    """Yield entries for lines starting within ``[start, end)`` bytes.
+
+    ``start`` must be the beginning of a line, as returned by
+    :func:`split_page_log`. The date window works as in
+    :func:`parse_page_log`.
+    """
+
+    return starmap(
+        LogEntry,
+        parse_page_log_range_tuples(path, start, end, start_date, end_date),
+    )
+
+
+def parse_page_log_range_tuples(
+    path: Path,
+    start: int,
+    end: int,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[LogRow]:
+    """Like :func:`parse_page_log_range`, but yield :data:`LogRow` tuples."""
+
+    if end <= start:
+        return  # also covers empty files, which cannot be mapped
+    with (
+        path.open("rb") as handle,
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view,
+    ):
+        lines_before: int | None = None
+
+        def warn(line_number: int, exc: ValueError) -> None:
+            # Number lines from the top of the file, not of the range;
+            # the prefix is only counted once a line is actually bad.
+            nonlocal lines_before
+            if lines_before is None:
+                lines_before = _count_lines(view, start)
+            _warn_skipped(lines_before + line_number, exc)
+
+        blocks = _read_range(view, start, _line_start(view, end))
+        yield from _parse_blocks(blocks, start_date, end_date, warn)
+
+
+def parse_page_log_parallel(
+    path: Path,
+    workers: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[LogEntry]:
+    """Like :func:`parse_page_log`, parsing byte ranges across processes.
+
+    Entries are yielded in file order. Files under ten megabytes, or a
+    single worker, are parsed serially in this process. Prefer
+    ``reporting.aggregate_parallel`` when only the report is needed: it
+    ships one partial aggregator per worker back rather than every row.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    size = path.stat().st_size
+    if workers <= 1 or size < PARALLEL_MIN_BYTES:
+        return parse_page_log(path, start_date, end_date)
+    chunks = max(workers, size // _PARALLEL_RANGE_BYTES)
+    ranges = split_page_log(path, chunks)
+    return starmap(
+        LogEntry,
+        _parse_ranges(path, ranges, workers, start_date, end_date),
+    )
+
+
+def _parse_ranges(
+    path: Path,
+    ranges: list[tuple[int, int]],
+    workers: int,
+    start_date: date | None,
+    end_date: date | None,
+) -> Iterator[LogRow]:
+    # Keep at most two ranges per worker in flight so a slow consumer
+    # does not pull the whole file into memory.
+    pending: deque[Future[list[LogRow]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, end in ranges:
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+            pending.append(
+                executor.submit(
+                    _parse_range_rows, path, start, end, start_date, end_date
+                )
+            )
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _parse_range_rows(
+    path: Path,
+    start: int,
+    end: int,
+    start_date: date | None,
+    end_date: date | None,
+) -> list[LogRow]:
+    return list(
+        parse_page_log_range_tuples(path, start, end, start_date, end_date)
+    )
+
+
+def split_page_log(
+    path: Path, chunks: int, start: int = 0, end: int | None = None
+) -> list[tuple[int, int]]:
+    """Split a page_log into up to ``chunks`` newline-aligned byte ranges.
+
+    ``start``/``end`` restrict the split to a window of the file; both
+    must be line starts (or the file size), e.g. from
+    :func:`find_date_offset`.
+    """
+
+    size = path.stat().st_size if end is None else end
+    span = size - start
+    bounds = [start]
+    with path.open("rb") as handle:
+        for index in range(1, max(chunks, 1)):
+            handle.seek(max(start + span * index // chunks, bounds[-1]))
+            handle.readline()  # snap forward to the next line start
+            offset = handle.tell()
+            if offset >= size:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def find_date_offset(path: Path, target: date) -> int:
+    """Return the byte offset of the first line dated on/after ``target``.
+
+    Only meaningful for a page_log in chronological order: the file is
+    binary-searched through a read-only mapping, reading one line per
+    probe. Returns the file size when every line is older than
+    ``target``. Lines without a valid header are stepped over.
+    """
+
+    size = path.stat().st_size
+    if not size:
+        return 0
+    with (
+        path.open("rb") as handle,
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view,
+    ):
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            day = _next_line_date(view, _line_start(view, middle))
+            if day is None or day >= target:
+                high = middle
+            else:
+                low = middle + 1
+        return _line_start(view, low)
+
+
+def _line_start(view: mmap.mmap, offset: int) -> int:
+    # First line start at or after ``offset``.
+    if offset == 0:
+        return 0
+    newline = view.find(b"\n", offset - 1)
+    return len(view) if newline < 0 else newline + 1
+
+
+def _next_line_date(view: mmap.mmap, offset: int) -> date | None:
+    # Date of the first parseable line from ``offset``; None at EOF.
+    view.seek(offset)
+    for raw in iter(view.readline, b""):
+        try:
+            header = _split_header(raw.decode("utf-8", errors="ignore"))
+            return _entry_date(header[3])
+        except ValueError:
+            continue
+    return None
+
+
+def _count_lines(view: mmap.mmap, end: int) -> int:
+    # Newlines in ``view[:end]``, counted a block at a time.
+    return sum(
+        view[offset : min(offset + _BLOCK_CHARS, end)].count(b"\n")
+        for offset in range(0, end, _BLOCK_CHARS)
+    )
+
+
+def _warn_skipped(line_number: int, exc: ValueError) -> None:
+    LOGGER.warning("Skipping line %d: %s", line_number, exc)
+
+
+def _read_range(view: mmap.mmap, start: int, end: int) -> Iterator[str]:
+    # Newline-aligned blocks of ``[start, end)``; ``end`` is a line start.
+    while start < end:
+        stop = min(start + _BLOCK_CHARS, end)
+        if stop < end:
+            newline = view.rfind(b"\n", start, stop)
+            stop = _line_start(view, stop) if newline < 0 else newline + 1
+        yield view[start:stop].decode("utf-8", errors="ignore")
+        start = stop
+
+
+def _whole_lines(chunks: Iterable[str]) -> Iterator[str]:
+    # Re-cut text chunks so every block ends on a newline (or at EOF).
+    carry = ""
+    for chunk in chunks:
+        cut = chunk.rfind("\n") + 1
+        if not cut:
+            carry += chunk
+            continue
+        yield carry + chunk[:cut]
+        carry = chunk[cut:]
+    if carry:
+        yield carry
+
+
+def _parse_blocks(
+    blocks: Iterable[str],
+    start_date: date | None = None,
+    end_date: date | None = None,
+    warn: Callable[[int, ValueError], None] = _warn_skipped,
+) -> Iterator[LogRow]:
+    """Parse newline-aligned text blocks, one regex scan per block.
+
+    :data:`_FAST_LINE` covers the common, single-space-separated layouts
+    and yields exactly what :func:`_parse_lines` would. Whatever it
+    skips (legacy oddities, padding, malformed rows) is handed to
+    :func:`_parse_lines` as the text between two matches. Rejected
+    lines are reported through ``warn`` with their 1-based number.
+    """
+
+    windowed = start_date is not None or end_date is not None
+    line_number = 1  # of the line starting at ``counted``
+    for block in blocks:
+        position = counted = 0
+        for match in _FAST_LINE.finditer(block):
+            begin = match.start()
+            if begin != position:
+                line_number += block.count("\n", counted, position)
+                counted = position
+                yield from _parse_lines(
+                    block[position:begin].split("\n"),
+                    start_date,
+                    end_date,
+                    line_number,
+                    warn,
+                )
+            position = match.end() + 1
+            (
+                printer,
+                user,
+                job_id,
+                raw_timestamp,
+                pages,
+                billing,
+                host,
+                job_name,
+                media,
+                sides,
+                legacy_pages,
+                legacy_copies,
+                legacy_billing,
+            ) = match.groups()
             try:
-                entry = parse_line(line)
+                if windowed and not _in_window(
+                    raw_timestamp, start_date, end_date
+                ):
+                    continue
+                timestamp = parse_timestamp(raw_timestamp)
             except ValueError as exc:
-                LOGGER.warning("Skipping line %d: %s", line_number, exc)
+                line_number += block.count("\n", counted, begin)
+                counted = begin
+                warn(line_number, exc)
+                continue
+            if pages is None:
+                yield (
+                    intern(printer),
+                    intern(user.lower()),
+                    int(job_id),
+                    timestamp,
+                    int(legacy_pages),
+                    int(legacy_copies),
+                    None if legacy_billing in _NO_BILLING else legacy_billing,
+                    None,
+                    None,
+                    None,
+                    None,
+                )
+                continue
+            yield (
+                intern(printer),
+                intern(user.lower()),
+                int(job_id),
+                timestamp,
+                int(pages),
+                1,
+                None if billing in _NO_BILLING else billing,
+                None if host == "-" else intern(host),
+                None if job_name == "-" else job_name,
+                None if media == "-" else intern(media),
+                None if sides == "-" else intern(sides),
+            )
+        if position < len(block):
+            line_number += block.count("\n", counted, position)
+            counted = position
+            yield from _parse_lines(
+                block[position:].split("\n"),
+                start_date,
+                end_date,
+                line_number,
+                warn,
+            )
+        line_number += block.count("\n", counted)
+
+
+def _parse_lines(
+    lines: Iterable[str],
+    start_date: date | None = None,
+    end_date: date | None = None,
+    first_line: int = 1,
+    warn: Callable[[int, ValueError], None] = _warn_skipped,
+) -> Iterator[LogRow]:
+    windowed = start_date is not None or end_date is not None
+    for line_number, line in enumerate(lines, start=first_line):
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        try:
+            header = _split_header(line)
+            if windowed and not _in_window(header[3], start_date, end_date):
                 continue
-            yield entry
+            row = _build_row(*header)
+        except ValueError as exc:
+            warn(line_number, exc)
+            continue
+        yield row
 
 
 def parse_line(line: str) -> LogEntry:
     """Parse a single page_log line."""
 
-    match = LINE_HEADER.match(line)
-    if not match:
+    return LogEntry(*_build_row(*_split_header(line)))
+
+
+def _build_row(
+    raw_printer: str,
+    raw_user: str,
+    raw_job_id: str,
+    raw_timestamp: str,
+    rest: str,
+) -> LogRow:
+
+    # Printer/user/host repeat on almost every line; intern them so the
+    # aggregator's counters share one key object per distinct value.
+    return (
+        intern(raw_printer),
+        # split() tokens are never blank or padded: lower() is all that
+        # normalize_user would still do.
+        intern(raw_user.lower()),
+        int(raw_job_id),
+        parse_timestamp(raw_timestamp),
+        *_parse_rest(rest),
+    )
+
+
+def _split_header(line: str) -> tuple[str, str, str, str, str]:
+    """
+    Split ``printer user job_id [timestamp] rest`` into its five fields.
+
+    Plain string operations replace a regex match on the hot path; the
+    accepted shape is the same (digits-only job id, non-empty bracketed
+    timestamp followed by whitespace and a payload).
+    """
+
+    parts = line.split(None, 3)
+    if (
+        len(parts) < 4
+        or line[:1].isspace()
+        or not parts[2].isdecimal()
+        or not parts[3].startswith("[")
+    ):
         raise ValueError("unrecognized header")
+    printer, user, job_id, tail = parts
+    close = tail.find("]", 1)
+    if close < 2 or not tail[close + 1 : close + 2].isspace():
+        raise ValueError("unrecognized header")
+    return printer, user, job_id, tail[1:close], tail[close + 1 :].lstrip()
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a page_log timestamp such as ``01/Apr/2025:09:03:11 -0300``.
+
+    Lines of one hour share everything but minutes and seconds, so the
+    hour is built once per distinct hour and offset; the rest is two
+    ``int`` calls. Anything off the fixed layout falls back to strptime.
+    """
+
+    if (
+        len(value) == 26
+        and value.isascii()  # keeps isdecimal() to ASCII digits
+        and value[14] == ":"
+        and value[17] == ":"
+        and value[20] == " "
+        and value[15:17].isdecimal()
+        and value[18:20].isdecimal()
+    ):
+        try:
+            hour = _hour_start(value[:14], value[21:])
+            return hour.replace(
+                minute=int(value[15:17]), second=int(value[18:20])
+            )
+        except ValueError:
+            pass  # let strptime report the error against ``value``
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+@lru_cache(maxsize=4096)
+def _hour_start(prefix: str, offset: str) -> datetime:
+    # "dd/Mon/YYYY:HH" and "+hhmm" from integer slices: CUPS always logs
+    # English month names, so skip strptime's locale-aware %b lookup.
+    month = _MONTHS.get(prefix[3:6])
+    if (
+        month is None
+        or prefix[2] != "/"
+        or prefix[6] != "/"
+        or prefix[11] != ":"
+        or not (prefix[:2] + prefix[7:11] + prefix[12:]).isdecimal()
+        or offset[0] not in "+-"
+        or not offset[1:].isdecimal()
+        or offset[3] > "5"
+    ):
+        return datetime.strptime(f"{prefix}:00:00 {offset}", DATE_FORMAT)
+    return datetime(
+        int(prefix[7:11]),
+        month,
+        int(prefix[:2]),
+        int(prefix[12:]),
+        tzinfo=_parse_tz(offset),
+    )
 
-    printer = match.group("printer")
-    user = normalize_user(match.group("user"))
-    job_id = int(match.group("job_id"))
-    timestamp = datetime.strptime(match.group("timestamp"), DATE_FORMAT)
-    rest = match.group("rest")
-
-    (
-        pages,
-        copies,
-        billing_code,
-        host,
-        job_name,
-        media,
-        sides,
-    ) = _parse_rest(rest)
-
-    return LogEntry(
-        printer=printer,
-        user=user,
-        job_id=job_id,
-        timestamp=timestamp,
-        pages=pages,
-        copies=copies,
-        billing_code=billing_code,
-        host=host,
-        job_name=job_name,
-        media=media,
-        sides=sides,
-        raw=line,
+
+@lru_cache(maxsize=64)
+def _parse_tz(offset: str) -> timezone:
+    minutes = int(offset[1:3]) * 60 + int(offset[3:])
+    return timezone(
+        timedelta(minutes=-minutes if offset[0] == "-" else minutes)
     )
 
 
+def _in_window(
+    raw_timestamp: str, start_date: date | None, end_date: date | None
+) -> bool:
+    day = _entry_date(raw_timestamp)
+    if start_date is not None and day < start_date:
+        return False
+    return end_date is None or day <= end_date
+
+
+def _entry_date(raw_timestamp: str) -> date:
+    # The local date is the literal "dd/Mon/YYYY" prefix; parse only that.
+    if len(raw_timestamp) == 26 and raw_timestamp[11] == ":":
+        return _prefix_date(raw_timestamp[:11])
+    return parse_timestamp(raw_timestamp).date()
+
+
+@lru_cache(maxsize=4096)
+def _prefix_date(prefix: str) -> date:
+    # "dd/Mon/YYYY" from integer slices, as in _hour_start.
+    month = _MONTHS.get(prefix[3:6])
+    if (
+        month is None
+        or not prefix.isascii()
+        or prefix[2] != "/"
+        or prefix[6] != "/"
+        or not (prefix[:2] + prefix[7:]).isdecimal()
+    ):
+        return datetime.strptime(prefix, "%d/%b/%Y").date()
+    return date(int(prefix[7:]), month, int(prefix[:2]))
+
+
 def _parse_rest(
     rest: str,
 ) -> tuple[
@@ -124,31 +619,40 @@ def _parse_rest(
             raise ValueError("legacy payload too short")
         pages = int(tokens[0])
         copies = int(tokens[1])
-        billing = normalize_billing(tokens[2])
+        billing = None if tokens[2] in _NO_BILLING else tokens[2]
         return pages, copies, billing, None, None, None, None
 
     # Default CUPS format
     keyword = tokens[0].lower()
     if keyword not in {"total", "page"}:
         raise ValueError(f"unknown keyword '{tokens[0]}'")
-    if len(tokens) < 4:
+    count = len(tokens)
+    if count < 4:
         raise ValueError("default payload too short")
 
     pages = int(tokens[1])
     copies = 1  # default format omits explicit copies
-    billing = normalize_billing(tokens[2])
-    remaining = tokens[3:]
+    billing = None if tokens[2] in _NO_BILLING else tokens[2]
 
-    if len(remaining) < 3:
+    if count < 6:
         raise ValueError("default payload missing host/job/media info")
 
-    host = normalize_optional(remaining[0])
-    media = normalize_optional(remaining[-2])
-    sides = normalize_optional(remaining[-1])
-    job_name_tokens = remaining[1:-2]
-    job_name = None
-    if job_name_tokens:
-        job_name = normalize_optional(" ".join(job_name_tokens))
+    # split() tokens are never blank, so "-" is the only empty marker;
+    # index into ``tokens`` rather than slicing and re-normalizing.
+    host = tokens[3]
+    host = None if host == "-" else intern(host)
+    media = tokens[-2]
+    media = None if media == "-" else intern(media)
+    sides = tokens[-1]
+    sides = None if sides == "-" else intern(sides)
+    if count == 7:
+        job_name: str | None = tokens[4]
+    elif count > 7:
+        job_name = " ".join(tokens[4:-2])
+    else:
+        job_name = None
+    if job_name == "-":
+        job_name = None
 
     return pages, copies, billing, host, job_name, media, sides
 
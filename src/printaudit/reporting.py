@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import reduce
 from pathlib import Path
 
 from .analysis import UsageAggregator
 from .config import Config
 from .outputs import OutputContext, get_output_module
-from .parser import parse_page_log
+from .parser import (
+    PARALLEL_MIN_BYTES,
+    find_date_offset,
+    parse_page_log_range_tuples,
+    parse_page_log_tuples,
+    split_page_log,
+)
+
+_CONSOLE_OUTPUTS = frozenset({"cli", "email"})
 
 
 def run_report(
@@ -19,28 +29,31 @@ def run_report(
 ) -> list[str]:
     """Run analysis pipeline and return generated artifact paths."""
 
-    aggregator = UsageAggregator(
-        cost_rules=config.cost_inference_rules,
-        work_start=config.work_start,
-        work_end=config.work_end,
-        cost_default=config.cost_default,
-        cost_printer_rates=config.cost_printer_rates,
-        cost_label_rates=config.cost_label_rates,
-    )
     page_log = Path(config.page_log_path)
+    if config.workers > 1:
+        aggregator = aggregate_parallel(
+            config, config.workers, start_date=start_date, end_date=end_date
+        )
+    elif config.page_log_sorted and (start_date or end_date):
+        aggregator = _aggregate_range(
+            config,
+            page_log,
+            *_date_window(page_log, start_date, end_date),
+            start_date,
+            end_date,
+        )
+    else:
+        aggregator = _new_aggregator(config)
+        aggregator.ingest_rows(
+            parse_page_log_tuples(page_log, start_date, end_date)
+        )
 
-    for entry in parse_page_log(page_log):
-        entry_date = entry.timestamp.date()
-        if start_date and entry_date < start_date:
-            continue
-        if end_date and entry_date > end_date:
-            continue
-        aggregator.ingest(entry)
-
-    report = aggregator.build_report()
+    outputs = _ordered_outputs(config.outputs)
+    report = aggregator.build_report(
+        enabled=_enabled_sections(config, outputs)
+    )
     context = OutputContext(config=config)
 
-    outputs = _ordered_outputs(config.outputs)
     for name in outputs:
         module_cls = get_output_module(name)
         module = module_cls(context)
@@ -49,9 +62,108 @@ def run_report(
     return context.attachments
 
 
+def aggregate_parallel(
+    config: Config,
+    workers: int,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> UsageAggregator:
+    """Aggregate the page_log in newline-aligned chunks across processes.
+
+    Each worker builds a partial :class:`UsageAggregator` for its byte
+    range; partials are merged in file order. With ``page_log_sorted``
+    only the byte window holding the requested dates is split. Spans
+    under :data:`~printaudit.parser.PARALLEL_MIN_BYTES` are aggregated
+    in this process, skipping pool start-up and pickling.
+    """
+
+    page_log = Path(config.page_log_path)
+    if config.page_log_sorted and (start_date or end_date):
+        window = _date_window(page_log, start_date, end_date)
+    else:
+        window = 0, page_log.stat().st_size
+    if window[1] - window[0] < PARALLEL_MIN_BYTES:
+        ranges = [window]
+    else:
+        ranges = split_page_log(page_log, workers, *window)
+    if len(ranges) == 1:
+        return _aggregate_range(
+            config, page_log, *ranges[0], start_date, end_date
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _aggregate_range,
+                config,
+                page_log,
+                start,
+                end,
+                start_date,
+                end_date,
+            )
+            for start, end in ranges
+        ]
+        partials = (future.result() for future in futures)
+        return reduce(UsageAggregator.merge, partials)
+
+
+def _aggregate_range(
+    config: Config,
+    page_log: Path,
+    start: int,
+    end: int,
+    start_date: date | None,
+    end_date: date | None,
+) -> UsageAggregator:
+    aggregator = _new_aggregator(config)
+    aggregator.ingest_rows(
+        parse_page_log_range_tuples(page_log, start, end, start_date, end_date)
+    )
+    return aggregator
+
+
+def _date_window(
+    page_log: Path, start_date: date | None, end_date: date | None
+) -> tuple[int, int]:
+    # Byte range of a chronological page_log covering the report dates.
+    start = find_date_offset(page_log, start_date) if start_date else 0
+    if end_date is None:
+        return start, page_log.stat().st_size
+    end = find_date_offset(page_log, end_date + timedelta(days=1))
+    return start, max(start, end)
+
+
+def _new_aggregator(config: Config) -> UsageAggregator:
+    return UsageAggregator(
+        cost_rules=config.cost_inference_rules,
+        work_start=config.work_start,
+        work_end=config.work_end,
+        cost_default=config.cost_default,
+        cost_printer_rates=config.cost_printer_rates,
+        cost_label_rates=config.cost_label_rates,
+    )
+
+
+def _enabled_sections(config: Config, outputs: list[str]) -> set[str] | None:
+    # CSV/HTML (and custom outputs) always export every section, so
+    # disabled sections can only be skipped for console-style reports.
+    if all(name in _CONSOLE_OUTPUTS for name in outputs):
+        return set(config.enabled_sections)
+    return None
+
+
 def _ordered_outputs(outputs: Iterable[str]) -> list[str]:
-    # Ensure email runs last if present
-    sanitized = [name.strip().lower() for name in outputs if name.strip()]
-    if "email" in sanitized:
-        sanitized = [name for name in sanitized if name != "email"] + ["email"]
-    return sanitized
+    # One pass: keep the configured order, but email always runs last
+    # (once) so it can attach what the other outputs wrote.
+    ordered: list[str] = []
+    has_email = False
+    for name in outputs:
+        name = name.strip().lower()
+        if name == "email":
+            has_email = True
+        elif name:
+            ordered.append(name)
+    if has_email:
+        ordered.append("email")
+    return ordered
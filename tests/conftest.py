@@ -1,7 +1,27 @@
 """Pytest configuration and shared fixtures."""
 
+from dataclasses import replace
+from datetime import datetime
+
 import pytest
 
+from printaudit.parser import LogEntry
+
+_ENTRY = LogEntry(
+    printer="Printer01",
+    user="alice",
+    job_id=12345,
+    timestamp=datetime(2025, 4, 1, 10, 0, 0),
+    pages=5,
+    copies=1,
+    billing_code=None,
+    host="192.168.1.1",
+    job_name="doc.pdf",
+    media=None,
+    sides=None,
+    raw="test line",
+)
+
 
 @pytest.fixture
 def sample_config(tmp_path):
@@ -29,3 +49,13 @@ def sample_page_log(tmp_path):
         "total 10 - 192.168.1.2 report.pdf - -\n"
     )
     return log_file
+
+
+@pytest.fixture(scope="module")
+def make_entry():
+    """Return a factory for LogEntry objects overriding a sample job."""
+
+    def make(**overrides):
+        return replace(_ENTRY, **overrides)
+
+    return make
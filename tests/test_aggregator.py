@@ -1,9 +1,15 @@
 """Tests for usage aggregation."""
 
+from dataclasses import astuple
 from datetime import datetime
 
-from printaudit.analysis.aggregator import UsageAggregator
-from printaudit.parser import LogEntry
+from printaudit.analysis.aggregator import (
+    COPY_BUCKETS,
+    JOB_BUCKETS,
+    UsageAggregator,
+    _bucketize_copy,
+    _bucketize_job,
+)
 
 
 def test_aggregator_initialization():
@@ -14,45 +20,19 @@ def test_aggregator_initialization():
     assert agg.cost_default == 0.0
 
 
-def test_aggregator_ingest_entry():
+def test_aggregator_ingest_entry(make_entry):
     """Test ingesting a log entry."""
     agg = UsageAggregator()
-    entry = LogEntry(
-        printer="Printer01",
-        user="alice",
-        job_id=12345,
-        timestamp=datetime(2025, 4, 1, 10, 0, 0),
-        pages=5,
-        copies=1,
-        billing_code=None,
-        host="192.168.1.1",
-        job_name="doc.pdf",
-        media=None,
-        sides=None,
-        raw="test line",
-    )
+    entry = make_entry()
     agg.ingest(entry)
     assert agg.totals.requests == 1
     assert agg.totals.pages == 5
 
 
-def test_aggregator_build_report():
+def test_aggregator_build_report(make_entry):
     """Test building a report."""
     agg = UsageAggregator()
-    entry = LogEntry(
-        printer="Printer01",
-        user="alice",
-        job_id=12345,
-        timestamp=datetime(2025, 4, 1, 10, 0, 0),
-        pages=5,
-        copies=1,
-        billing_code=None,
-        host="192.168.1.1",
-        job_name="doc.pdf",
-        media=None,
-        sides=None,
-        raw="test line",
-    )
+    entry = make_entry()
     agg.ingest(entry)
     report = agg.build_report()
     assert report.totals.requests == 1
@@ -61,23 +41,10 @@ def test_aggregator_build_report():
     assert len(report.user_stats) > 0
 
 
-def test_aggregator_cost_calculation_default_rate():
+def test_aggregator_cost_calculation_default_rate(make_entry):
     """Test cost calculation with default rate."""
     agg = UsageAggregator(cost_default=0.05)
-    entry = LogEntry(
-        printer="Printer01",
-        user="alice",
-        job_id=12345,
-        timestamp=datetime(2025, 4, 1, 10, 0, 0),
-        pages=10,
-        copies=1,
-        billing_code=None,
-        host="192.168.1.1",
-        job_name="doc.pdf",
-        media=None,
-        sides=None,
-        raw="test line",
-    )
+    entry = make_entry(pages=10)
     agg.ingest(entry)
     report = agg.build_report()
     # Cost should be calculated (10 pages * 0.05 = 0.5)
@@ -85,47 +52,30 @@ def test_aggregator_cost_calculation_default_rate():
     assert report.totals.pages == 10
 
 
-def test_aggregator_cost_calculation_printer_rate():
+def test_aggregator_cost_calculation_printer_rate(make_entry):
     """Test cost calculation with printer-specific rate."""
     agg = UsageAggregator(
         cost_default=0.05,
         cost_printer_rates={"printer01": 0.02},
     )
-    entry = LogEntry(
-        printer="Printer01",
-        user="alice",
-        job_id=12345,
-        timestamp=datetime(2025, 4, 1, 10, 0, 0),
-        pages=10,
-        copies=1,
-        billing_code=None,
-        host="192.168.1.1",
-        job_name="doc.pdf",
-        media=None,
-        sides=None,
-        raw="test line",
-    )
+    entry = make_entry(pages=10)
     agg.ingest(entry)
     report = agg.build_report()
     assert report.totals.pages == 10
 
 
-def test_aggregator_multiple_entries():
+def test_aggregator_multiple_entries(make_entry):
     """Test aggregating multiple entries."""
     agg = UsageAggregator()
     for i in range(5):
-        entry = LogEntry(
+        entry = make_entry(
             printer=f"Printer{i % 2 + 1}",
             user=f"user{i}",
             job_id=10000 + i,
             timestamp=datetime(2025, 4, 1, 10, i, 0),
             pages=i + 1,
-            copies=1,
-            billing_code=None,
             host=f"192.168.1.{i}",
             job_name=f"doc{i}.pdf",
-            media=None,
-            sides=None,
             raw=f"test line {i}",
         )
         agg.ingest(entry)
@@ -133,3 +83,129 @@ def test_aggregator_multiple_entries():
     assert report.totals.requests == 5
     assert report.totals.pages == 15  # 1+2+3+4+5
     assert len(report.queue_stats) == 2  # Two different printers
+
+
+def test_aggregator_ingest_batch_matches_ingest(make_entry):
+    """Test that batch ingestion yields the same report as ingest."""
+    entries = [
+        make_entry(
+            printer=f"Printer{i % 2 + 1}",
+            user=f"user{i % 3}",
+            job_id=20000 + i,
+            timestamp=datetime(2025, 4, 1 + i % 2, 8 + i, 0, 0),
+            pages=i + 1,
+            host=f"192.168.1.{i}",
+            job_name=f"doc{i}.pdf",
+            raw=f"test line {i}",
+        )
+        for i in range(6)
+    ]
+    single = UsageAggregator()
+    for entry in entries:
+        single.ingest(entry)
+    batch = UsageAggregator()
+    batch.ingest_batch(entries)
+    assert batch.build_report() == single.build_report()
+    rows = UsageAggregator()
+    rows.ingest_rows(astuple(entry)[:-1] for entry in entries)
+    assert rows.build_report() == single.build_report()
+
+
+def test_aggregator_cost_rules_assign_label(make_entry):
+    """Test that cost rules assign labels and compute amounts."""
+    agg = UsageAggregator(
+        cost_rules={"accounting": "alice|carol"},
+        cost_default=0.05,
+        cost_printer_rates={"printer02": 0.10},
+    )
+    for i, (printer, user) in enumerate(
+        [("Printer01", "alice"), ("Printer02", "alice"), ("Printer01", "bob")]
+    ):
+        agg.ingest(
+            make_entry(
+                printer=printer,
+                user=user,
+                job_id=30000 + i,
+                timestamp=datetime(2025, 4, 1, 10, i, 0),
+                pages=10,
+            )
+        )
+    report = agg.build_report()
+    costs = {stat.label: stat for stat in report.cost_stats}
+    assert costs["accounting"].pages == 20
+    assert costs["accounting"].per_user == [("alice", 20)]
+    assert costs["accounting"].amount == 10 * 0.05 + 10 * 0.10
+    assert costs["unassigned"].per_queue == [("Printer01", 10)]
+
+
+def test_specialized_bucketize_matches_generic():
+    """Test that the bisect-based bucket lookups match _bucketize."""
+    for value in range(-1, 300):
+        assert _bucketize_job(value) == UsageAggregator._bucketize(
+            value, JOB_BUCKETS
+        )
+        assert _bucketize_copy(value) == UsageAggregator._bucketize(
+            value, COPY_BUCKETS
+        )
+
+
+def test_aggregator_build_report_limit(make_entry):
+    """Test that a report limit keeps only the top ranked rows."""
+    agg = UsageAggregator()
+    for i in range(6):
+        agg.ingest(
+            make_entry(
+                user=f"user{i}",
+                job_id=40000 + i,
+                timestamp=datetime(2025, 4, 1, 10, i, 0),
+                pages=i + 1,
+                host=f"192.168.1.{i}",
+            )
+        )
+    full = agg.build_report()
+    limited = agg.build_report(limit=3)
+    assert limited.user_stats == full.user_stats[:3]
+    assert limited.queue_stats == full.queue_stats[:3]
+    assert limited.queue_user_stats == full.queue_user_stats[:3]
+    assert limited.client_stats == full.client_stats[:3]
+    assert limited.user_stats[0].user == "user5"
+    assert limited.totals == full.totals
+
+
+def test_aggregator_merge_matches_serial(make_entry):
+    """Test that merging partial aggregators equals one serial pass."""
+    entries = [
+        make_entry(
+            printer=f"Printer{i % 3}",
+            user=f"user{i % 4}",
+            job_id=50000 + i,
+            timestamp=datetime(2025, 4, 1 + i % 3, 6 + i, 0, 0),
+            pages=i % 5,
+            copies=1 + i % 2,
+            billing_code="project" if i % 4 == 0 else None,
+            host=f"192.168.1.{i % 3}",
+            job_name=f"doc{i}.pdf",
+            sides="two-sided-long-edge" if i % 2 else None,
+        )
+        for i in range(12)
+    ]
+    serial = UsageAggregator(cost_default=0.1)
+    serial.ingest_batch(entries)
+    parts = [UsageAggregator(cost_default=0.1) for _ in range(3)]
+    for index, part in enumerate(parts):
+        part.ingest_batch(entries[index * 4 : (index + 1) * 4])
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert merged.build_report() == serial.build_report()
+
+
+def test_aggregator_build_report_enabled_sections(make_entry):
+    """Test that disabled sections are left empty."""
+    agg = UsageAggregator()
+    agg.ingest(make_entry())
+    report = agg.build_report(enabled={"queue", "user"})
+    assert report.queue_stats and report.user_stats
+    assert report.queue_user_stats == []
+    assert report.hourly == [] and report.daily == []
+    assert report.job_buckets == [] and report.cost_stats == []
+    assert report.media_stats and report.client_stats
+    assert report.totals.pages == 5
@@ -1,8 +1,18 @@
 """Tests for configuration parsing."""
 
+import ast
+import os
+from collections import Counter
+
 import pytest
 
-from printaudit.config import Config, ConfigError, parse_config
+from printaudit import config as config_module
+from printaudit.config import (
+    Config,
+    ConfigError,
+    discover_config_file,
+    parse_config,
+)
 
 
 def test_config_defaults():
@@ -111,3 +121,166 @@ report_in_body=true
     config = parse_config(config_file)
     assert config.email.enabled is True
     assert config.email.report_in_body is True
+
+
+def test_parse_config_key_outside_section(tmp_path):
+    """Test that keys before any section header raise ConfigError."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("work_start=8\n[core]\nwork_end=20\n")
+    with pytest.raises(ConfigError):
+        parse_config(config_file)
+
+
+def test_parse_config_cache_returns_copies(tmp_path):
+    """Test that cached configs are isolated and refreshed on change."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("[core]\nwork_start=8\noutputs=cli\n")
+    first = parse_config(config_file)
+    first.outputs.append("csv")
+    second = parse_config(config_file)
+    assert second.outputs == ["cli"]
+
+    config_file.write_text("[core]\nwork_start=9\noutputs=cli,html\n")
+    third = parse_config(config_file)
+    assert third.work_start == 9
+    assert third.outputs == ["cli", "html"]
+
+
+def test_parse_config_cache_sees_replaced_file(tmp_path):
+    """Test that a swapped-in file with the same mtime and size reloads."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("[core]\nwork_start=8\n")
+    assert parse_config(config_file).work_start == 8
+    stat = config_file.stat()
+
+    replacement = tmp_path / "test.conf.new"
+    replacement.write_text("[core]\nwork_start=9\n")
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, config_file)
+    assert config_file.stat().st_size == stat.st_size
+    assert parse_config(config_file).work_start == 9
+
+
+def test_parse_config_invalid_value_names_key(tmp_path):
+    """Test that values a caster rejects raise ConfigError with the key."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("[core]\nworkers=1   # inline comment\n")
+    with pytest.raises(ConfigError, match="Invalid value for workers"):
+        parse_config(config_file)
+
+    config_file.write_text("[costs]\nprinter.hp=cheap\n")
+    with pytest.raises(ConfigError, match="Invalid value for printer.hp"):
+        parse_config(config_file)
+
+
+def test_parse_config_email_from_address(tmp_path):
+    """Test that both sender keys populate EmailSettings.from_address."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("[email]\nfrom=a@example.com\n")
+    assert parse_config(config_file).email.from_address == "a@example.com"
+
+    config_file.write_text("[email]\nfrom_address=bb@example.com\n")
+    assert parse_config(config_file).email.from_address == "bb@example.com"
+
+
+def test_config_module_defines_each_name_once():
+    """Test that config.py has a single definition per top-level name."""
+    with open(config_module.__file__, encoding="utf-8") as handle:
+        tree = ast.parse(handle.read())
+    names = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    )
+    assert [name for name, count in names.items() if count > 1] == []
+
+
+def test_read_config_file_reuses_sections_until_file_changes(tmp_path):
+    """Test that raw sections are cached by the file's stat fingerprint."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text("[Core]\nwork_start=8\n[cost_rules]\nA=x\n")
+    first = config_module._read_config_file(config_file)
+    assert first == {"core": {"work_start": "8"}, "cost_rules": {"a": "x"}}
+    assert config_module._read_config_file(config_file) is first
+
+    config_file.write_text("[core]\nwork_start=10\n")
+    assert config_module._read_config_file(config_file) == {
+        "core": {"work_start": "10"}
+    }
+
+
+def test_discover_config_file_drops_deleted_cached_path(tmp_path, monkeypatch):
+    """Test that a cached config that disappears is looked up again."""
+    first = tmp_path / "first.conf"
+    second = tmp_path / "second.conf"
+    for config_file in (first, second):
+        config_file.write_text("[core]\n")
+    monkeypatch.setattr(
+        config_module, "_default_paths", lambda: [first, second]
+    )
+    monkeypatch.delenv("PRINTAUDIT_CONFIG", raising=False)
+    assert discover_config_file() == first
+
+    first.unlink()
+    assert discover_config_file() == second
+    second.unlink()
+    with pytest.raises(ConfigError, match="No configuration file found"):
+        parse_config()
+
+
+def test_read_config_file_missing_raises_config_error(tmp_path):
+    """Test that a config vanishing after discovery is a ConfigError."""
+    with pytest.raises(ConfigError, match="Cannot read config file"):
+        config_module._read_config_file(tmp_path / "gone.conf")
+
+
+def test_split_plain_sections_matches_configparser_grammar():
+    """Test the hand-rolled INI reader and when it defers to configparser."""
+    text = "# note\n[Core]\n; other\nWork_Start = 8 \n\n[core]\nx=a=b\n"
+    assert config_module._split_plain_sections(text) == {
+        "Core": {"work_start": "8"},
+        "core": {"x": "a=b"},
+    }
+    for text in (
+        "[core]\noutputs=cli,\n  html\n",
+        "[core]\nwork_start: 8\n",
+        "[DEFAULT]\nwork_start=8\n[core]\n",
+        "work_start=8\n",
+        "[core]\ngarbage\n",
+    ):
+        assert config_module._split_plain_sections(text) is None
+
+
+def test_read_config_file_falls_back_for_continuations(tmp_path):
+    """Test that syntax outside the fast path still parses as before."""
+    config_file = tmp_path / "test.conf"
+    config_file.write_text(
+        "[DEFAULT]\nwork_end=17\n[core]\nwork_start: 8\n"
+        "outputs=cli,\n  html\n"
+    )
+    assert config_module._read_config_file(config_file) == {
+        "core": {
+            "work_start": "8",
+            "outputs": "cli,\nhtml",
+            "work_end": "17",
+        }
+    }
+    config = parse_config(config_file)
+    assert config.work_start == 8
+    assert config.work_end == 17
+
+
+def test_discover_config_file_uses_current_directory(tmp_path, monkeypatch):
+    """Test that the working-directory candidate is resolved per call."""
+    monkeypatch.delenv("PRINTAUDIT_CONFIG", raising=False)
+    monkeypatch.setattr(config_module, "_SYSTEM_CONF_PATHS", ())
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    for directory in (first_dir, second_dir):
+        directory.mkdir()
+        (directory / "printaudit.conf").write_text("[core]\n")
+
+    monkeypatch.chdir(first_dir)
+    assert discover_config_file() == first_dir / "printaudit.conf"
+    monkeypatch.chdir(second_dir)
+    assert discover_config_file() == second_dir / "printaudit.conf"
@@ -0,0 +1,87 @@
+"""Tests for CSV output formatting."""
+
+import csv
+from io import StringIO
+from pathlib import Path
+
+from printaudit.analysis.aggregator import UsageAggregator
+from printaudit.config import Config
+from printaudit.outputs.base import OutputContext
+from printaudit.outputs.csv_writer import CsvOutput, _csv_line
+from printaudit.parser import parse_page_log
+
+
+def _reference_line(row):
+    buffer = StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()[:-2]
+
+
+def test_csv_line_matches_csv_writer():
+    """Test that the join fast path and csv fallback match csv.writer."""
+    rows = [
+        ("Printer01", 12.5, 40.0, 3, 18),
+        ("alice", 0, 0.1 + 0.2),
+        ("a,b", 'say "hi"', 1),
+        ("multi\nline", "cr\rhere", ""),
+        ("",),
+        ("", ""),
+    ]
+    for row in rows:
+        assert _csv_line(row) == _reference_line(row)
+
+
+def test_csv_output_writes_every_table_in_order(tmp_path, sample_page_log):
+    """Test that all CSV files are written and attached in a fixed order."""
+    aggregator = UsageAggregator()
+    aggregator.ingest_batch(parse_page_log(sample_page_log))
+    config = Config(csv_dir=tmp_path / "csv")
+    context = OutputContext(config=config)
+
+    CsvOutput(context).render(aggregator.build_report())
+
+    names = [Path(path).name for path in context.attachments]
+    assert names == [
+        "queue.csv",
+        "queue_user.csv",
+        "users.csv",
+        "hourly.csv",
+        "daily.csv",
+        "job_buckets.csv",
+        "copy_buckets.csv",
+        "cost.csv",
+        "clients.csv",
+        "document_types.csv",
+        "media.csv",
+        "duplex.csv",
+    ]
+    queue_csv = (tmp_path / "csv" / "queue.csv").read_bytes()
+    assert queue_csv.startswith(
+        b"queue,requests_pct,pages_pct,requests,pages\r\n"
+    )
+
+
+def test_csv_output_single_file(tmp_path, sample_page_log):
+    """Test that csv_single_file folds every table into report.csv."""
+    aggregator = UsageAggregator()
+    aggregator.ingest_batch(parse_page_log(sample_page_log))
+    config = Config(csv_dir=tmp_path / "csv", csv_single_file=True)
+    context = OutputContext(config=config)
+
+    CsvOutput(context).render(aggregator.build_report())
+
+    report_path = tmp_path / "csv" / "report.csv"
+    assert context.attachments == [str(report_path)]
+    with report_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == [
+        "section",
+        "queue",
+        "requests_pct",
+        "pages_pct",
+        "requests",
+        "pages",
+    ]
+    assert ["section", "mode", "pages"] in rows
+    sections = {row[0] for row in rows if row[0] != "section"}
+    assert {"queue", "users", "hourly", "duplex"} <= sections
@@ -2,6 +2,7 @@
 
 from printaudit.analysis.aggregator import UsageAggregator
 from printaudit.config import Config
+from printaudit.emailer import EmailClient
 from printaudit.outputs.base import OutputContext
 from printaudit.outputs.email_sender import EmailOutput
 from printaudit.parser import parse_line
@@ -65,3 +66,84 @@ def test_email_body_omits_report_in_body_when_disabled(monkeypatch):
     assert "PrintAudit summary" in captured["body"]
     assert "Console output" not in captured["body"]
     assert "PrintAudit Summary" not in captured["body"]
+
+
+def test_email_attachments_use_guessed_mime_types(monkeypatch, tmp_path):
+    config = Config()
+    config.email.enabled = True
+    config.email.recipients = ["ops@example.com"]
+    csv_path = tmp_path / "queue_stats.csv"
+    csv_path.write_text("queue,pages\r\nPrinter01,5\r\n")
+    blob_path = tmp_path / "report.bin"
+    blob_path.write_bytes(b"\x00\x01")
+
+    sent = []
+    monkeypatch.setattr(
+        EmailClient, "_send", lambda self, msg: sent.append(msg)
+    )
+
+    EmailClient(config.email).send_report(
+        "subject", "body", [csv_path, blob_path]
+    )
+
+    parts = {
+        part.get_filename(): part.get_content_type()
+        for part in sent[0].iter_attachments()
+    }
+    assert parts == {
+        "queue_stats.csv": "text/csv",
+        "report.bin": "application/octet-stream",
+    }
+
+
+def test_email_client_context_reuses_one_connection(monkeypatch):
+    config = Config()
+    config.email.enabled = True
+    config.email.recipients = ["ops@example.com"]
+    config.email.smtp_user = "ops"
+    connections = []
+
+    class FakeSMTP:
+        def __init__(self, host, port, timeout):
+            self.logins = 0
+            self.sent = []
+            self.closed = False
+            connections.append(self)
+
+        def login(self, user, password):
+            self.logins += 1
+
+        def send_message(self, message):
+            self.sent.append(message["Subject"])
+
+        def quit(self):
+            self.closed = True
+
+    monkeypatch.setattr("printaudit.emailer.smtplib.SMTP", FakeSMTP)
+
+    with EmailClient(config.email) as client:
+        client.send_report("first", "body")
+        client.send_report("second", "body")
+
+    assert len(connections) == 1
+    assert connections[0].logins == 1
+    assert connections[0].sent == ["first", "second"]
+    assert connections[0].closed
+
+
+def test_email_selects_attachments_by_suffix():
+    config = Config()
+    config.email.attach_csv = True
+    config.email.attach_html = False
+    context = OutputContext(
+        config=config,
+        attachments=["out/queue.csv", "out/report.html", "out/users.csv"],
+    )
+
+    selected = EmailOutput(context)._select_attachments()
+    assert [path.name for path in selected] == ["queue.csv", "users.csv"]
+
+    config.email.attach_csv = False
+    config.email.attach_html = True
+    selected = EmailOutput(context)._select_attachments()
+    assert [path.name for path in selected] == ["report.html"]
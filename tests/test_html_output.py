@@ -0,0 +1,71 @@
+"""Tests for HTML output rendering."""
+
+import json
+
+from printaudit.analysis.aggregator import UsageAggregator
+from printaudit.config import Config
+from printaudit.outputs import html_report
+from printaudit.outputs.base import OutputContext
+from printaudit.outputs.html_report import HtmlOutput
+from printaudit.parser import parse_line
+
+
+def _render(tmp_path, *lines):
+    aggregator = UsageAggregator()
+    for line in lines:
+        aggregator.ingest(parse_line(line))
+    config = Config(html_path=tmp_path / "report.html")
+    context = OutputContext(config=config)
+    HtmlOutput(context).render(aggregator.build_report())
+    return (tmp_path / "report.html").read_text(encoding="utf-8")
+
+
+def test_html_tables_escape_cell_values(tmp_path):
+    """Test that names from the log cannot inject markup into tables."""
+    html = _render(
+        tmp_path,
+        "Printer01 <b>eve</b> 12345 [01/Apr/2025:09:03:11 -0300] "
+        "total 5 - 192.168.1.1 doc.pdf - -",
+    )
+    assert "<td>&lt;b&gt;eve&lt;/b&gt;</td>" in html
+    assert "<td><b>eve</b></td>" not in html
+
+
+def test_html_data_blob_cannot_close_script(tmp_path):
+    """Test that names in the inline JSON cannot end the script element."""
+    html = _render(
+        tmp_path,
+        "</script><i>x alice 12345 [01/Apr/2025:09:03:11 -0300] "
+        "total 5 - 192.168.1.1 doc.pdf - -",
+    )
+    assert "</script><i>" not in html
+    assert '"queue":"<\\/script><i>x"' in html
+
+
+def test_html_data_blob_same_without_orjson(tmp_path, monkeypatch):
+    """Test that the stdlib JSON fallback writes the same page."""
+    line = (
+        "Impressão joão 12345 [01/Apr/2025:09:03:11 -0300] "
+        "total 5 - 192.168.1.1 relatório.pdf - -"
+    )
+    fast = _render(tmp_path, line)
+    monkeypatch.setattr(html_report, "_FAST_DUMPS", None)
+    assert _render(tmp_path, line) == fast
+    assert '"queue":"Impressão"' in fast
+
+
+def test_html_data_blob_holds_only_chart_series(tmp_path):
+    """Test that the inline JSON carries just the charted queues/hours."""
+    html = _render(
+        tmp_path,
+        *(
+            f"Printer{i:02d} user{i} {i} [0{1 + i % 3}/Apr/2025:09:03:11 "
+            f"-0300] total {i + 1} - 10.0.0.{i} doc{i}.pdf - -"
+            for i in range(12)
+        ),
+    )
+    blob = html.split("const data = ", 1)[1].split(";\n", 1)[0]
+    data = json.loads(blob.replace("<\\/", "</"))
+    assert sorted(data) == ["hourly", "queue"]
+    assert len(data["queue"]) == 10
+    assert "<td>user0</td>" in html
@@ -1,8 +1,29 @@
 """Integration tests for PrintAudit workflow."""
 
+import sys
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from printaudit import reporting
 from printaudit.analysis.aggregator import UsageAggregator
 from printaudit.config import parse_config
+from printaudit.outputs import get_output_module, list_outputs
+from printaudit.outputs.base import (
+    REGISTRY,
+    OutputContext,
+    OutputModule,
+    register_output,
+)
+from printaudit.outputs.cli import CliOutput
 from printaudit.parser import parse_page_log
+from printaudit.reporting import (
+    _ordered_outputs,
+    aggregate_parallel,
+    run_report,
+)
 
 
 def test_end_to_end_workflow(tmp_path):
@@ -59,3 +80,177 @@ outputs=cli
     # Printer02 has more pages (10) so should be first
     assert report.queue_stats[0].queue == "Printer02"
     assert report.queue_stats[0].pages == 10
+
+
+def test_parallel_aggregation_matches_serial(tmp_path, monkeypatch):
+    """Test that multi-process aggregation matches a serial run."""
+    monkeypatch.setattr(reporting, "PARALLEL_MIN_BYTES", 0)
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "".join(
+            f"Printer0{i % 3} user{i % 5} {1000 + i} "
+            f"[0{1 + i % 3}/Apr/2025:{8 + i % 10:02d}:03:11 -0300] "
+            f"total {i % 7 + 1} - 192.168.1.{i % 4} doc{i}.pdf - -\n"
+            for i in range(40)
+        )
+    )
+    config_file = tmp_path / "printaudit.conf"
+    config_file.write_text(
+        f"""[core]
+page_log_path={log_file}
+workers=3
+"""
+    )
+    config = parse_config(config_file)
+    assert config.workers == 3
+
+    serial = UsageAggregator(
+        work_start=config.work_start,
+        work_end=config.work_end,
+    )
+    serial.ingest_batch(parse_page_log(config.page_log_path))
+    parallel = aggregate_parallel(config, config.workers)
+    assert parallel.build_report() == serial.build_report()
+
+    # Below the threshold the same call never starts a process pool.
+    monkeypatch.setattr(reporting, "PARALLEL_MIN_BYTES", 1 << 20)
+    monkeypatch.setattr(reporting, "ProcessPoolExecutor", None)
+    small = aggregate_parallel(config, config.workers)
+    assert small.build_report() == serial.build_report()
+
+
+def test_sorted_page_log_window_matches_full_scan(tmp_path, monkeypatch):
+    """Test that seeking a sorted page_log keeps the windowed totals."""
+    monkeypatch.setattr(reporting, "PARALLEL_MIN_BYTES", 0)
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "".join(
+            f"Printer0{i % 3} user{i % 5} {1000 + i} "
+            f"[{1 + i // 6:02d}/Apr/2025:{8 + i % 10:02d}:03:11 -0300] "
+            f"total {i % 7 + 1} - 192.168.1.{i % 4} doc{i}.pdf - -\n"
+            for i in range(60)
+        )
+    )
+    start, end = date(2025, 4, 3), date(2025, 4, 6)
+    reports = {}
+    for sorted_log, workers in ((False, 1), (True, 1), (True, 3)):
+        config_file = tmp_path / "printaudit.conf"
+        config_file.write_text(
+            f"""[core]
+page_log_path={log_file}
+outputs=csv
+csv_dir={tmp_path / f"csv-{sorted_log}-{workers}"}
+workers={workers}
+page_log_sorted={str(sorted_log).lower()}
+"""
+        )
+        config = parse_config(config_file)
+        assert config.page_log_sorted is sorted_log
+        attachments = run_report(config, start_date=start, end_date=end)
+        reports[sorted_log, workers] = [
+            Path(path).read_text(encoding="utf-8") for path in attachments
+        ]
+    assert reports[True, 1] == reports[False, 1]
+    assert reports[True, 3] == reports[False, 1]
+
+
+def test_cli_output_skips_disabled_sections(sample_config, sample_page_log):
+    """Test that the CLI only prints sections listed in enabled_sections."""
+    config = parse_config(sample_config)
+    config.enabled_sections = ["user"]
+    agg = UsageAggregator(
+        work_start=config.work_start, work_end=config.work_end
+    )
+    agg.ingest_batch(parse_page_log(sample_page_log))
+
+    out = StringIO()
+    CliOutput(OutputContext(config=config, stdout=out)).render(
+        agg.build_report()
+    )
+    text = out.getvalue()
+    assert "USER ANALYSIS" in text
+    assert "MEDIA & CLIENT ANALYSIS" in text
+    assert "QUEUE ANALYSIS" not in text
+    assert "COST ANALYSIS" not in text
+
+
+def test_cli_output_queue_user_section_stands_alone(
+    sample_config, sample_page_log
+):
+    """Test that queue_user prints its breakdown without the queue table."""
+    config = parse_config(sample_config)
+    agg = UsageAggregator(
+        work_start=config.work_start, work_end=config.work_end
+    )
+    agg.ingest_batch(parse_page_log(sample_page_log))
+    report = agg.build_report()
+
+    texts = {}
+    for sections in ("queue_user", "queue", "queue,queue_user"):
+        config.enabled_sections = sections.split(",")
+        out = StringIO()
+        CliOutput(OutputContext(config=config, stdout=out)).render(report)
+        texts[sections] = out.getvalue()
+    assert "Queue-User breakdown:" in texts["queue_user"]
+    assert "QUEUE ANALYSIS" not in texts["queue_user"]
+    assert "Queue-User breakdown:" not in texts["queue"]
+    both = texts["queue,queue_user"]
+    assert "QUEUE ANALYSIS" in both and "Queue-User breakdown:" in both
+    assert "\n\nQueue-User breakdown:" not in both
+
+
+def test_output_backends_load_on_demand():
+    """Test that built-in outputs resolve without eager package imports."""
+    assert get_output_module("csv").name == "csv"
+    assert list_outputs() == ["cli", "csv", "email", "html"]
+
+
+def test_ordered_outputs_runs_email_last_once():
+    """Test that outputs keep their order with email moved to the end."""
+    assert _ordered_outputs([" Email", "cli", "", "HTML ", "email"]) == [
+        "cli",
+        "html",
+        "email",
+    ]
+    assert _ordered_outputs(["csv", " "]) == ["csv"]
+
+
+def test_output_registry_holds_one_class_per_backend():
+    """Test that each backend module loads once and registers once."""
+    names = list_outputs()
+    assert len(REGISTRY) == len(names)
+    assert [
+        module for module in sys.modules if module.endswith(".html_report")
+    ] == ["printaudit.outputs.html_report"]
+    html_cls = get_output_module("html")
+    assert html_cls.__module__ == "printaudit.outputs.html_report"
+
+    class OtherHtml(OutputModule):
+        def render(self, report):
+            pass
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_output("html")(OtherHtml)
+    assert get_output_module("html") is html_cls
+    assert list_outputs() == names
+
+
+def test_cli_output_writes_to_current_stdout(
+    sample_config, sample_page_log, monkeypatch
+):
+    """Test that a context without a stream follows sys.stdout."""
+    config = parse_config(sample_config)
+    agg = UsageAggregator(
+        work_start=config.work_start, work_end=config.work_end
+    )
+    agg.ingest_batch(parse_page_log(sample_page_log))
+    context = OutputContext(config=config)
+
+    redirected = StringIO()
+    monkeypatch.setattr("sys.stdout", redirected)
+    assert context.stdout is redirected
+    CliOutput(context).render(agg.build_report())
+    assert "QUEUE ANALYSIS" in redirected.getvalue()
+
+    explicit = StringIO()
+    assert OutputContext(config=config, stdout=explicit).stdout is explicit
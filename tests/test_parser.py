@@ -1,8 +1,24 @@
 """Tests for page_log parsing."""
 
+import logging
+from dataclasses import astuple
+from datetime import date, datetime
+
 import pytest
 
-from printaudit.parser import parse_line, parse_page_log
+from printaudit import parser
+from printaudit.parser import (
+    DATE_FORMAT,
+    LogEntry,
+    find_date_offset,
+    parse_line,
+    parse_page_log,
+    parse_page_log_parallel,
+    parse_page_log_range,
+    parse_page_log_tuples,
+    parse_timestamp,
+    split_page_log,
+)
 
 
 def test_parse_line_basic():
@@ -45,6 +61,20 @@ def test_parse_page_log_file(tmp_path):
     assert len(entries) == 2
     assert entries[0].printer == "Printer01"
     assert entries[1].printer == "Printer02"
+    assert all(entry.raw is None for entry in entries)
+    assert list(parse_page_log_tuples(log_file)) == [
+        astuple(entry)[:-1] for entry in entries
+    ]
+
+
+def test_log_entry_is_compact_record():
+    """Test that entries stay slotted and accept LogRow fields in order."""
+    entry = parse_line(
+        "Printer01 alice 12345 [01/Apr/2025:09:03:11 -0300] "
+        "total 5 - 192.168.1.1 doc.pdf - -"
+    )
+    assert not hasattr(entry, "__dict__")
+    assert LogEntry(*astuple(entry)[:-1]) == entry
 
 
 def test_parse_line_invalid():
@@ -53,6 +83,16 @@ def test_parse_line_invalid():
         parse_line("invalid line format")
 
 
+def test_parse_line_accepts_short_and_tab_separated_rows():
+    """Test that no space-count guard rejects valid legacy or tab rows."""
+    legacy = parse_line("P u 1 [01/Apr/2025:09:03:11 -0300] 5 1 -")
+    assert (legacy.pages, legacy.copies, legacy.host) == (5, 1, None)
+    tabbed = parse_line(
+        "P\tu\t1\t[01/Apr/2025:09:03:11\t-0300]\ttotal\t5\t-\th\td\t-\t-"
+    )
+    assert (tabbed.pages, tabbed.host, tabbed.job_name) == (5, "h", "d")
+
+
 def test_parse_line_with_billing_code():
     """Test parsing line with billing code."""
     line = (
@@ -84,3 +124,280 @@ def test_parse_line_job_name_with_spaces():
     )
     entry = parse_line(line)
     assert entry.job_name == "My Document Name.pdf"
+
+
+def test_split_page_log_ranges_cover_all_lines(tmp_path):
+    """Test that newline-aligned ranges yield every entry exactly once."""
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "".join(
+            f"Printer0{i % 3} user{i} {1000 + i} "
+            "[01/Apr/2025:09:03:11 -0300] "
+            f"total {i + 1} - 192.168.1.{i} doc{i}.pdf - -\n"
+            for i in range(25)
+        )
+    )
+    ranges = split_page_log(log_file, 4)
+    assert len(ranges) == 4
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == log_file.stat().st_size
+    chunked = [
+        entry.job_id
+        for start, end in ranges
+        for entry in parse_page_log_range(log_file, start, end)
+    ]
+    assert chunked == [entry.job_id for entry in parse_page_log(log_file)]
+
+
+def test_parse_page_log_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that parallel parsing yields the serial entries in order."""
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "".join(
+            f"Printer0{i % 3} user{i} {1000 + i} "
+            f"[0{1 + i % 3}/Apr/2025:09:03:11 -0300] "
+            f"total {i + 1} - 192.168.1.{i} doc{i}.pdf - -\n"
+            for i in range(40)
+        )
+    )
+    serial = list(parse_page_log(log_file))
+    assert list(parse_page_log_parallel(log_file, 2)) == serial
+
+    monkeypatch.setattr(parser, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(parser, "_PARALLEL_RANGE_BYTES", 256)
+    assert list(parse_page_log_parallel(log_file, 2)) == serial
+    window = date(2025, 4, 2), date(2025, 4, 2)
+    assert list(parse_page_log_parallel(log_file, 2, *window)) == list(
+        parse_page_log(log_file, *window)
+    )
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        " Printer01 alice 1 [01/Apr/2025:09:03:11 -0300] total 5 - h d - -",
+        "Printer01 alice 1a [01/Apr/2025:09:03:11 -0300] total 5 - h d - -",
+        "Printer01 alice 1 [] total 5 - h d - -",
+        "Printer01 alice 1 [01/Apr/2025:09:03:11 -0300]total 5 - h d - -",
+        "Printer01 alice 1 01/Apr/2025:09:03:11 -0300 total 5 - h d - -",
+        "Printer01 alice 1 [01/Apr/2025:09:03:11 -0300]",
+    ],
+)
+def test_parse_line_rejects_malformed_headers(line):
+    """Test that malformed headers are rejected before the payload."""
+    with pytest.raises(ValueError):
+        parse_line(line)
+
+
+def test_parse_line_accepts_tab_separated_header():
+    """Test that any whitespace run separates header fields."""
+    entry = parse_line(
+        "Printer01\talice  12345\t[01/Apr/2025:09:03:11 -0300]  "
+        "total 5 - 192.168.1.1 doc.pdf - -"
+    )
+    assert (entry.printer, entry.user, entry.job_id) == (
+        "Printer01",
+        "alice",
+        12345,
+    )
+    assert entry.job_name == "doc.pdf"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "01/Apr/2025:09:03:11 -0300",
+        "01/Apr/2025:09:59:59 -0300",
+        "01/Apr/2025:09:00:00 +0530",
+        "31/Dec/2024:23:00:00 +0000",
+        "01/apr/2025:09:03:11 -0300",
+        "1/Apr/2025:09:03:11 -0300",
+        "01/Apr/2025:09:03:11 Z",
+    ],
+)
+def test_parse_timestamp_matches_strptime(value):
+    """Test that the per-hour cache agrees with a full strptime."""
+    expected = datetime.strptime(value, DATE_FORMAT)
+    parsed = parse_timestamp(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "01/Apr/2025:09:60:11 -0300",
+        "01/Apr/2025:24:03:11 -0300",
+        "31/Feb/2025:09:03:11 -0300",
+        "01/Apr/2025:09:03:11 +0060",
+        "01/Apr/2025:09:03:\u06611 -0300",
+    ],
+)
+def test_parse_timestamp_rejects_out_of_range_fields(value):
+    """Test that invalid clock fields still raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_timestamp(value)
+
+
+def test_parse_timestamp_shares_timezone_objects():
+    """Test that one UTC offset maps to one cached timezone instance."""
+    first = parse_timestamp("01/Apr/2025:09:03:11 -0300")
+    later = parse_timestamp("02/May/2025:17:45:00 -0300")
+    assert first.tzinfo is later.tzinfo
+    other = parse_timestamp("01/Apr/2025:09:03:11 +0100")
+    assert other.tzinfo is not first.tzinfo
+
+
+@pytest.mark.parametrize(
+    "prefix", ["01/Apr/2025", "31/Dec/2024", "01/apr/2025", " 1/Apr/2025"]
+)
+def test_prefix_date_matches_strptime(prefix):
+    """Test that the date-window prefix parse agrees with strptime."""
+    expected = datetime.strptime(prefix, "%d/%b/%Y").date()
+    assert parser._prefix_date(prefix) == expected
+
+
+def test_parse_page_log_date_window(tmp_path):
+    """Test that the parser drops lines outside the date window."""
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "".join(
+            f"Printer01 user{day} {day} [{day:02d}/Apr/2025:23:30:00 -0300] "
+            f"total {day} - 192.168.1.1 doc.pdf - -\n"
+            for day in range(1, 8)
+        )
+    )
+    start, end = date(2025, 4, 3), date(2025, 4, 5)
+    expected = [
+        entry
+        for entry in parse_page_log(log_file)
+        if start <= entry.timestamp.date() <= end
+    ]
+    assert [entry.job_id for entry in expected] == [3, 4, 5]
+    assert list(parse_page_log(log_file, start, end)) == expected
+    assert (
+        list(parse_page_log(log_file, end_date=start))
+        == list(parse_page_log(log_file))[:3]
+    )
+
+    ranges = split_page_log(log_file, 3)
+    windowed = [
+        entry
+        for range_start, range_end in ranges
+        for entry in parse_page_log_range(
+            log_file, range_start, range_end, start, end
+        )
+    ]
+    assert windowed == expected
+
+
+def test_parse_page_log_range_empty_file(tmp_path):
+    """Test that an empty page_log yields no entries from its range."""
+    log_file = tmp_path / "page_log"
+    log_file.write_bytes(b"")
+    assert split_page_log(log_file, 4) == [(0, 0)]
+    assert list(parse_page_log_range(log_file, 0, 0)) == []
+
+
+def test_find_date_offset_on_sorted_log(tmp_path):
+    """Test binary search for the first line on or after a date."""
+    lines = [
+        f"Printer01 alice {day} [{day:02d}/Apr/2025:09:00:00 -0300] "
+        f"total 1 - 192.168.1.1 doc.pdf - -\n"
+        for day in range(1, 8)
+        for _ in range(3)
+    ]
+    lines.insert(7, "garbage line\n")
+    log_file = tmp_path / "page_log"
+    log_file.write_text("".join(lines))
+    data = log_file.read_bytes()
+
+    for day in range(1, 8):
+        offset = find_date_offset(log_file, date(2025, 4, day))
+        assert data[offset:].startswith(f"Printer01 alice {day} ".encode())
+    assert find_date_offset(log_file, date(2025, 3, 1)) == 0
+    assert find_date_offset(log_file, date(2025, 5, 1)) == len(data)
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert find_date_offset(empty, date(2025, 4, 1)) == 0
+
+
+def test_parse_page_log_warning_quotes_original_timestamp(tmp_path, caplog):
+    """Test that a bad timestamp is reported as it appears in the log."""
+    log_file = tmp_path / "page_log"
+    log_file.write_text(
+        "Printer01 alice 1 [21/Foo/2025:20:47:13 -0300] "
+        "total 5 - 192.168.1.1 doc.pdf - -\n"
+    )
+    with caplog.at_level(logging.WARNING, logger="printaudit.parser"):
+        assert list(parse_page_log(log_file)) == []
+    (record,) = caplog.records
+    message = record.getMessage()
+    assert message.startswith("Skipping line 1:")
+    assert "'21/Foo/2025:20:47:13 -0300'" in message
+    assert "20:00:00" not in message
+
+
+def test_range_warnings_cite_file_line_numbers(tmp_path, caplog):
+    """Test that byte ranges report bad lines by their line in the file."""
+    lines = [
+        f"Printer01 user{i} {i} [0{1 + i // 4}/Apr/2025:09:03:11 -0300] "
+        f"total 1 - 192.168.1.1 doc.pdf - -"
+        for i in range(12)
+    ]
+    lines[7] = "not a page_log line"
+    log_file = tmp_path / "page_log"
+    log_file.write_text("\n".join(lines) + "\n")
+
+    def warnings(ranges, *window):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="printaudit.parser"):
+            for start, end in ranges:
+                list(parse_page_log_range(log_file, start, end, *window))
+        return [record.getMessage().split(":")[0] for record in caplog.records]
+
+    assert warnings(split_page_log(log_file, 3)) == ["Skipping line 8"]
+    window = find_date_offset(log_file, date(2025, 4, 2))
+    size = log_file.stat().st_size
+    assert warnings([(window, size)], date(2025, 4, 2)) == ["Skipping line 8"]
+
+
+def test_parse_page_log_mixed_layouts_match_parse_line(
+    tmp_path, monkeypatch, caplog
+):
+    """Test that bulk parsing agrees with parse_line across layouts."""
+    lines = [
+        "Printer01 alice 1 [01/Apr/2025:09:03:11 -0300] "
+        "total 5 - 192.168.1.1 doc.pdf - -",
+        "Printer01 Bob 2 [01/Apr/2025:09:04:00 -0300] 3 2 proj",
+        "not a page_log line",
+        "Printer02  carol 3 [01/Apr/2025:10:00:00 -0300] "
+        "total 1 -none- host  my  report.pdf A4 one-sided",
+        "",
+        "Printer02 dave 4 [01/Apr/2025:25:00:00 -0300] "
+        "total 1 - host doc.pdf - -",
+        "Printer03 erin 5 [01/Apr/2025:11:00:00 -0300] "
+        "TOTAL 2 - host a b c.pdf A4 -",
+    ]
+    log_file = tmp_path / "page_log"
+    log_file.write_text("\n".join(lines) + "\n")
+    expected = []
+    for line in lines:
+        try:
+            expected.append(parse_line(line))
+        except ValueError:
+            pass
+    assert len(expected) == 4
+
+    monkeypatch.setattr(parser, "_BLOCK_CHARS", 64)  # force block cuts
+    with caplog.at_level(logging.WARNING, logger="printaudit.parser"):
+        assert list(parse_page_log(log_file)) == expected
+    assert [
+        record.getMessage().split(":")[0] for record in caplog.records
+    ] == [
+        "Skipping line 3",
+        "Skipping line 6",
+    ]
+    size = log_file.stat().st_size
+    assert list(parse_page_log_range(log_file, 0, size)) == expected